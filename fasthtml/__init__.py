@@ -2,7 +2,8 @@
 
 Modules:
 
-- `fasthtml.core`: The `FastHTML` subclass of `Starlette`."""
+- `fasthtml.core`: The `FastHTML` subclass of `Starlette`.
+- `fasthtml.sessions`: Session middleware: server-side sessions, where the cookie carries only an opaque id and the session itself lives in a store, and signed cookie sessions that are only re-signed when they change."""
 
 __version__ = "0.14.13"
 from .core import *
@@ -8,6 +8,7 @@ d = { 'settings': { 'branch': 'main',
   'syms': { 'fasthtml.authmw': {},
             'fasthtml.basics': {},
             'fasthtml.cli': { 'fasthtml.cli._run': ('api/cli.html#_run', 'fasthtml/cli.py'),
+                              'fasthtml.cli.build_manifest': ('api/cli.html#build_manifest', 'fasthtml/cli.py'),
                               'fasthtml.cli.railway_deploy': ('api/cli.html#railway_deploy', 'fasthtml/cli.py'),
                               'fasthtml.cli.railway_link': ('api/cli.html#railway_link', 'fasthtml/cli.py')},
             'fasthtml.common': {},
@@ -40,9 +41,18 @@ d = { 'settings': { 'branch': 'main',
                                'fasthtml.core.Beforeware': ('api/core.html#beforeware', 'fasthtml/core.py'),
                                'fasthtml.core.Beforeware.__init__': ('api/core.html#beforeware.__init__', 'fasthtml/core.py'),
                                'fasthtml.core.Beforeware.__repr__': ('api/core.html#beforeware.__repr__', 'fasthtml/core.py'),
+                               'fasthtml.core.Beforeware.skip_re': ('api/core.html#beforeware.skip_re', 'fasthtml/core.py'),
                                'fasthtml.core.Client': ('api/core.html#client', 'fasthtml/core.py'),
                                'fasthtml.core.Client.__init__': ('api/core.html#client.__init__', 'fasthtml/core.py'),
                                'fasthtml.core.Client._sync': ('api/core.html#client._sync', 'fasthtml/core.py'),
+                               'fasthtml.core.CompressMiddleware': ('api/core.html#compressmiddleware', 'fasthtml/core.py'),
+                               'fasthtml.core.CompressMiddleware.__call__': ( 'api/core.html#compressmiddleware.__call__',
+                                                                              'fasthtml/core.py'),
+                               'fasthtml.core.CompressMiddleware.__init__': ( 'api/core.html#compressmiddleware.__init__',
+                                                                              'fasthtml/core.py'),
+                               'fasthtml.core.CompressMiddleware._compress': ( 'api/core.html#compressmiddleware._compress',
+                                                                               'fasthtml/core.py'),
+                               'fasthtml.core.CompressMiddleware._should': ('api/core.html#compressmiddleware._should', 'fasthtml/core.py'),
                                'fasthtml.core.EventStream': ('api/core.html#eventstream', 'fasthtml/core.py'),
                                'fasthtml.core.FastHTML': ('api/core.html#fasthtml', 'fasthtml/core.py'),
                                'fasthtml.core.FastHTML.__init__': ('api/core.html#fasthtml.__init__', 'fasthtml/core.py'),
@@ -50,6 +60,7 @@ d = { 'settings': { 'branch': 'main',
                                'fasthtml.core.FastHTML._add_routes': ('api/core.html#fasthtml._add_routes', 'fasthtml/core.py'),
                                'fasthtml.core.FastHTML._add_ws': ('api/core.html#fasthtml._add_ws', 'fasthtml/core.py'),
                                'fasthtml.core.FastHTML._endp': ('api/core.html#fasthtml._endp', 'fasthtml/core.py'),
+                               'fasthtml.core.FastHTML._hooks': ('api/core.html#fasthtml._hooks', 'fasthtml/core.py'),
                                'fasthtml.core.FastHTML.add_route': ('api/core.html#fasthtml.add_route', 'fasthtml/core.py'),
                                'fasthtml.core.FastHTML.add_websocket_route': ( 'api/core.html#fasthtml.add_websocket_route',
                                                                                'fasthtml/core.py'),
@@ -76,7 +87,17 @@ d = { 'settings': { 'branch': 'main',
                                'fasthtml.core.HtmxHeaders': ('api/core.html#htmxheaders', 'fasthtml/core.py'),
                                'fasthtml.core.HtmxHeaders.__bool__': ('api/core.html#htmxheaders.__bool__', 'fasthtml/core.py'),
                                'fasthtml.core.HtmxResponseHeaders': ('api/core.html#htmxresponseheaders', 'fasthtml/core.py'),
+                               'fasthtml.core.HttpCache': ('api/core.html#httpcache', 'fasthtml/core.py'),
+                               'fasthtml.core.HttpCache.__init__': ('api/core.html#httpcache.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core.HttpCache.check': ('api/core.html#httpcache.check', 'fasthtml/core.py'),
+                               'fasthtml.core.HttpCache.fetch': ('api/core.html#httpcache.fetch', 'fasthtml/core.py'),
+                               'fasthtml.core.HttpCache.not_modified': ('api/core.html#httpcache.not_modified', 'fasthtml/core.py'),
+                               'fasthtml.core.HttpCache.respond': ('api/core.html#httpcache.respond', 'fasthtml/core.py'),
                                'fasthtml.core.HttpHeader': ('api/core.html#httpheader', 'fasthtml/core.py'),
+                               'fasthtml.core.IndexedRouter': ('api/core.html#indexedrouter', 'fasthtml/core.py'),
+                               'fasthtml.core.IndexedRouter._build_index': ('api/core.html#indexedrouter._build_index', 'fasthtml/core.py'),
+                               'fasthtml.core.IndexedRouter.app': ('api/core.html#indexedrouter.app', 'fasthtml/core.py'),
+                               'fasthtml.core.IndexedRouter.candidates': ('api/core.html#indexedrouter.candidates', 'fasthtml/core.py'),
                                'fasthtml.core.JSONResponse': ('api/core.html#jsonresponse', 'fasthtml/core.py'),
                                'fasthtml.core.JSONResponse.render': ('api/core.html#jsonresponse.render', 'fasthtml/core.py'),
                                'fasthtml.core.Lifespan': ('api/core.html#lifespan', 'fasthtml/core.py'),
@@ -84,64 +105,203 @@ d = { 'settings': { 'branch': 'main',
                                'fasthtml.core.Lifespan.__init__': ('api/core.html#lifespan.__init__', 'fasthtml/core.py'),
                                'fasthtml.core.Lifespan._run': ('api/core.html#lifespan._run', 'fasthtml/core.py'),
                                'fasthtml.core.Lifespan.on_event': ('api/core.html#lifespan.on_event', 'fasthtml/core.py'),
+                               'fasthtml.core.LocalBroadcast': ('api/core.html#localbroadcast', 'fasthtml/core.py'),
+                               'fasthtml.core.LocalBroadcast.__init__': ('api/core.html#localbroadcast.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core.LocalBroadcast.deliver': ('api/core.html#localbroadcast.deliver', 'fasthtml/core.py'),
+                               'fasthtml.core.LocalBroadcast.publish': ('api/core.html#localbroadcast.publish', 'fasthtml/core.py'),
+                               'fasthtml.core.LocalBroadcast.start': ('api/core.html#localbroadcast.start', 'fasthtml/core.py'),
+                               'fasthtml.core.LocalBroadcast.stop': ('api/core.html#localbroadcast.stop', 'fasthtml/core.py'),
+                               'fasthtml.core.LocalBroadcast.subscribe': ('api/core.html#localbroadcast.subscribe', 'fasthtml/core.py'),
+                               'fasthtml.core.LocalBroadcast.unsubscribe': ('api/core.html#localbroadcast.unsubscribe', 'fasthtml/core.py'),
                                'fasthtml.core.MiddlewareBase': ('api/core.html#middlewarebase', 'fasthtml/core.py'),
                                'fasthtml.core.MiddlewareBase.__call__': ('api/core.html#middlewarebase.__call__', 'fasthtml/core.py'),
                                'fasthtml.core.Redirect': ('api/core.html#redirect', 'fasthtml/core.py'),
                                'fasthtml.core.Redirect.__init__': ('api/core.html#redirect.__init__', 'fasthtml/core.py'),
                                'fasthtml.core.Redirect.__response__': ('api/core.html#redirect.__response__', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache': ('api/core.html#responsecache', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache.__init__': ('api/core.html#responsecache.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache._drop': ('api/core.html#responsecache._drop', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache._key': ('api/core.html#responsecache._key', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache._load': ('api/core.html#responsecache._load', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache._refresh': ('api/core.html#responsecache._refresh', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache._store': ('api/core.html#responsecache._store', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache.fetch': ('api/core.html#responsecache.fetch', 'fasthtml/core.py'),
+                               'fasthtml.core.ResponseCache.invalidate': ('api/core.html#responsecache.invalidate', 'fasthtml/core.py'),
                                'fasthtml.core.RouteFuncs': ('api/core.html#routefuncs', 'fasthtml/core.py'),
                                'fasthtml.core.RouteFuncs.__dir__': ('api/core.html#routefuncs.__dir__', 'fasthtml/core.py'),
                                'fasthtml.core.RouteFuncs.__getattr__': ('api/core.html#routefuncs.__getattr__', 'fasthtml/core.py'),
                                'fasthtml.core.RouteFuncs.__init__': ('api/core.html#routefuncs.__init__', 'fasthtml/core.py'),
                                'fasthtml.core.RouteFuncs.__setattr__': ('api/core.html#routefuncs.__setattr__', 'fasthtml/core.py'),
+                               'fasthtml.core.StaticCache': ('api/core.html#staticcache', 'fasthtml/core.py'),
+                               'fasthtml.core.StaticCache.__init__': ('api/core.html#staticcache.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core.StaticCache._cached': ('api/core.html#staticcache._cached', 'fasthtml/core.py'),
+                               'fasthtml.core.StaticCache._load': ('api/core.html#staticcache._load', 'fasthtml/core.py'),
+                               'fasthtml.core.StaticCache._store': ('api/core.html#staticcache._store', 'fasthtml/core.py'),
+                               'fasthtml.core.StaticCache._variant': ('api/core.html#staticcache._variant', 'fasthtml/core.py'),
+                               'fasthtml.core.StaticCache.get': ('api/core.html#staticcache.get', 'fasthtml/core.py'),
+                               'fasthtml.core.StaticCache.response': ('api/core.html#staticcache.response', 'fasthtml/core.py'),
                                'fasthtml.core.StaticImmutable': ('api/core.html#staticimmutable', 'fasthtml/core.py'),
                                'fasthtml.core.StaticImmutable.file_response': ( 'api/core.html#staticimmutable.file_response',
                                                                                 'fasthtml/core.py'),
                                'fasthtml.core.StaticNoCache': ('api/core.html#staticnocache', 'fasthtml/core.py'),
                                'fasthtml.core.StaticNoCache.file_response': ( 'api/core.html#staticnocache.file_response',
                                                                               'fasthtml/core.py'),
+                               'fasthtml.core.StreamingFtResponse': ('api/core.html#streamingftresponse', 'fasthtml/core.py'),
+                               'fasthtml.core.StreamingFtResponse.__init__': ( 'api/core.html#streamingftresponse.__init__',
+                                                                               'fasthtml/core.py'),
+                               'fasthtml.core.StreamingFtResponse.__response__': ( 'api/core.html#streamingftresponse.__response__',
+                                                                                   'fasthtml/core.py'),
                                'fasthtml.core.StringConvertor.to_string': ('api/core.html#stringconvertor.to_string', 'fasthtml/core.py'),
+                               'fasthtml.core.UnixBroadcast': ('api/core.html#unixbroadcast', 'fasthtml/core.py'),
+                               'fasthtml.core.UnixBroadcast.__init__': ('api/core.html#unixbroadcast.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core.UnixBroadcast._peer_socks': ('api/core.html#unixbroadcast._peer_socks', 'fasthtml/core.py'),
+                               'fasthtml.core.UnixBroadcast._send': ('api/core.html#unixbroadcast._send', 'fasthtml/core.py'),
+                               'fasthtml.core.UnixBroadcast._serve': ('api/core.html#unixbroadcast._serve', 'fasthtml/core.py'),
+                               'fasthtml.core.UnixBroadcast.publish': ('api/core.html#unixbroadcast.publish', 'fasthtml/core.py'),
+                               'fasthtml.core.UnixBroadcast.start': ('api/core.html#unixbroadcast.start', 'fasthtml/core.py'),
+                               'fasthtml.core.UnixBroadcast.stop': ('api/core.html#unixbroadcast.stop', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart': ('api/core.html#uploadpart', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.__aiter__': ('api/core.html#uploadpart.__aiter__', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.__init__': ('api/core.html#uploadpart.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.__repr__': ('api/core.html#uploadpart.__repr__', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.digest': ('api/core.html#uploadpart.digest', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.drain': ('api/core.html#uploadpart.drain', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.read': ('api/core.html#uploadpart.read', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.save': ('api/core.html#uploadpart.save', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.spool': ('api/core.html#uploadpart.spool', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadPart.text': ('api/core.html#uploadpart.text', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadStream': ('api/core.html#uploadstream', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadStream.__aiter__': ('api/core.html#uploadstream.__aiter__', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadStream.__init__': ('api/core.html#uploadstream.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadStream._events': ('api/core.html#uploadstream._events', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadStream.config': ('api/core.html#uploadstream.config', 'fasthtml/core.py'),
+                               'fasthtml.core.UploadStream.form': ('api/core.html#uploadstream.form', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub': ('api/core.html#wshub', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub.__init__': ('api/core.html#wshub.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub._deliver': ('api/core.html#wshub._deliver', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub._put': ('api/core.html#wshub._put', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub._writer': ('api/core.html#wshub._writer', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub.connect': ('api/core.html#wshub.connect', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub.disconnect': ('api/core.html#wshub.disconnect', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub.publish': ('api/core.html#wshub.publish', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub.subscribe': ('api/core.html#wshub.subscribe', 'fasthtml/core.py'),
+                               'fasthtml.core.WSHub.unsubscribe': ('api/core.html#wshub.unsubscribe', 'fasthtml/core.py'),
+                               'fasthtml.core._AnyRe': ('api/core.html#_anyre', 'fasthtml/core.py'),
+                               'fasthtml.core._AnyRe.__init__': ('api/core.html#_anyre.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core._AnyRe.fullmatch': ('api/core.html#_anyre.fullmatch', 'fasthtml/core.py'),
+                               'fasthtml.core._Cached': ('api/core.html#_cached', 'fasthtml/core.py'),
+                               'fasthtml.core._Cached.__init__': ('api/core.html#_cached.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core._Cached.response': ('api/core.html#_cached.response', 'fasthtml/core.py'),
+                               'fasthtml.core._Deferred': ('api/core.html#_deferred', 'fasthtml/core.py'),
+                               'fasthtml.core._Deferred.__init__': ('api/core.html#_deferred.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core._Deferred.pattern': ('api/core.html#_deferred.pattern', 'fasthtml/core.py'),
+                               'fasthtml.core._Deferred.placeholder': ('api/core.html#_deferred.placeholder', 'fasthtml/core.py'),
+                               'fasthtml.core._Lazy': ('api/core.html#_lazy', 'fasthtml/core.py'),
                                'fasthtml.core._LifespanCtx': ('api/core.html#_lifespanctx', 'fasthtml/core.py'),
                                'fasthtml.core._LifespanCtx.__aenter__': ('api/core.html#_lifespanctx.__aenter__', 'fasthtml/core.py'),
                                'fasthtml.core._LifespanCtx.__aexit__': ('api/core.html#_lifespanctx.__aexit__', 'fasthtml/core.py'),
                                'fasthtml.core._LifespanCtx.__aiter__': ('api/core.html#_lifespanctx.__aiter__', 'fasthtml/core.py'),
                                'fasthtml.core._LifespanCtx.__anext__': ('api/core.html#_lifespanctx.__anext__', 'fasthtml/core.py'),
                                'fasthtml.core._LifespanCtx.__init__': ('api/core.html#_lifespanctx.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core._NeedsData': ('api/core.html#_needsdata', 'fasthtml/core.py'),
+                               'fasthtml.core._NoData': ('api/core.html#_nodata', 'fasthtml/core.py'),
+                               'fasthtml.core._NoData.get': ('api/core.html#_nodata.get', 'fasthtml/core.py'),
+                               'fasthtml.core._Plan': ('api/core.html#_plan', 'fasthtml/core.py'),
+                               'fasthtml.core._WSBatch': ('api/core.html#_wsbatch', 'fasthtml/core.py'),
+                               'fasthtml.core._WSBatch.__init__': ('api/core.html#_wsbatch.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core._WSBatch.add': ('api/core.html#_wsbatch.add', 'fasthtml/core.py'),
+                               'fasthtml.core._WSBatch.flush': ('api/core.html#_wsbatch.flush', 'fasthtml/core.py'),
+                               'fasthtml.core._WSConn': ('api/core.html#_wsconn', 'fasthtml/core.py'),
+                               'fasthtml.core._WSConn.__init__': ('api/core.html#_wsconn.__init__', 'fasthtml/core.py'),
+                               'fasthtml.core._accept_encs': ('api/core.html#_accept_encs', 'fasthtml/core.py'),
                                'fasthtml.core._add_ids': ('api/core.html#_add_ids', 'fasthtml/core.py'),
+                               'fasthtml.core._aitems': ('api/core.html#_aitems', 'fasthtml/core.py'),
+                               'fasthtml.core._anno_caster': ('api/core.html#_anno_caster', 'fasthtml/core.py'),
+                               'fasthtml.core._anno_getter': ('api/core.html#_anno_getter', 'fasthtml/core.py'),
                                'fasthtml.core._annotations': ('api/core.html#_annotations', 'fasthtml/core.py'),
+                               'fasthtml.core._app_url_path': ('api/core.html#_app_url_path', 'fasthtml/core.py'),
+                               'fasthtml.core._attr_getter': ('api/core.html#_attr_getter', 'fasthtml/core.py'),
+                               'fasthtml.core._body_decoder': ('api/core.html#_body_decoder', 'fasthtml/core.py'),
+                               'fasthtml.core._body_getter': ('api/core.html#_body_getter', 'fasthtml/core.py'),
+                               'fasthtml.core._br_enc': ('api/core.html#_br_enc', 'fasthtml/core.py'),
+                               'fasthtml.core._buffered': ('api/core.html#_buffered', 'fasthtml/core.py'),
+                               'fasthtml.core._can_encode': ('api/core.html#_can_encode', 'fasthtml/core.py'),
                                'fasthtml.core._canonical': ('api/core.html#_canonical', 'fasthtml/core.py'),
                                'fasthtml.core._check_anno': ('api/core.html#_check_anno', 'fasthtml/core.py'),
-                               'fasthtml.core._find_p': ('api/core.html#_find_p', 'fasthtml/core.py'),
+                               'fasthtml.core._defer': ('api/core.html#_defer', 'fasthtml/core.py'),
+                               'fasthtml.core._etag': ('api/core.html#_etag', 'fasthtml/core.py'),
+                               'fasthtml.core._etag_match': ('api/core.html#_etag_match', 'fasthtml/core.py'),
+                               'fasthtml.core._fhash': ('api/core.html#_fhash', 'fasthtml/core.py'),
+                               'fasthtml.core._field_caster': ('api/core.html#_field_caster', 'fasthtml/core.py'),
+                               'fasthtml.core._fill_lazy': ('api/core.html#_fill_lazy', 'fasthtml/core.py'),
                                'fasthtml.core._find_ps': ('api/core.html#_find_ps', 'fasthtml/core.py'),
                                'fasthtml.core._find_targets': ('api/core.html#_find_targets', 'fasthtml/core.py'),
-                               'fasthtml.core._fix_anno': ('api/core.html#_fix_anno', 'fasthtml/core.py'),
-                               'fasthtml.core._form_arg': ('api/core.html#_form_arg', 'fasthtml/core.py'),
                                'fasthtml.core._formitem': ('api/core.html#_formitem', 'fasthtml/core.py'),
                                'fasthtml.core._from_body': ('api/core.html#_from_body', 'fasthtml/core.py'),
+                               'fasthtml.core._ft_chunks': ('api/core.html#_ft_chunks', 'fasthtml/core.py'),
+                               'fasthtml.core._ft_xml': ('api/core.html#_ft_xml', 'fasthtml/core.py'),
                                'fasthtml.core._get_htmx': ('api/core.html#_get_htmx', 'fasthtml/core.py'),
+                               'fasthtml.core._gzip_enc': ('api/core.html#_gzip_enc', 'fasthtml/core.py'),
                                'fasthtml.core._handle': ('api/core.html#_handle', 'fasthtml/core.py'),
+                               'fasthtml.core._has_lazy': ('api/core.html#_has_lazy', 'fasthtml/core.py'),
+                               'fasthtml.core._hook': ('api/core.html#_hook', 'fasthtml/core.py'),
+                               'fasthtml.core._index_lookup': ('api/core.html#_index_lookup', 'fasthtml/core.py'),
                                'fasthtml.core._is_body': ('api/core.html#_is_body', 'fasthtml/core.py'),
                                'fasthtml.core._is_ft_resp': ('api/core.html#_is_ft_resp', 'fasthtml/core.py'),
+                               'fasthtml.core._is_lazy': ('api/core.html#_is_lazy', 'fasthtml/core.py'),
+                               'fasthtml.core._json_default': ('api/core.html#_json_default', 'fasthtml/core.py'),
+                               'fasthtml.core._lazy_leaf': ('api/core.html#_lazy_leaf', 'fasthtml/core.py'),
                                'fasthtml.core._list': ('api/core.html#_list', 'fasthtml/core.py'),
                                'fasthtml.core._mk_list': ('api/core.html#_mk_list', 'fasthtml/core.py'),
                                'fasthtml.core._mk_locfunc': ('api/core.html#_mk_locfunc', 'fasthtml/core.py'),
+                               'fasthtml.core._msgspec_backend': ('api/core.html#_msgspec_backend', 'fasthtml/core.py'),
+                               'fasthtml.core._name_getter': ('api/core.html#_name_getter', 'fasthtml/core.py'),
+                               'fasthtml.core._nbytes': ('api/core.html#_nbytes', 'fasthtml/core.py'),
+                               'fasthtml.core._nparams': ('api/core.html#_nparams', 'fasthtml/core.py'),
+                               'fasthtml.core._orjson_backend': ('api/core.html#_orjson_backend', 'fasthtml/core.py'),
+                               'fasthtml.core._orjson_default': ('api/core.html#_orjson_default', 'fasthtml/core.py'),
+                               'fasthtml.core._page_attr': ('api/core.html#_page_attr', 'fasthtml/core.py'),
+                               'fasthtml.core._page_parts': ('api/core.html#_page_parts', 'fasthtml/core.py'),
+                               'fasthtml.core._page_shell': ('api/core.html#_page_shell', 'fasthtml/core.py'),
+                               'fasthtml.core._param_getter': ('api/core.html#_param_getter', 'fasthtml/core.py'),
                                'fasthtml.core._params': ('api/core.html#_params', 'fasthtml/core.py'),
                                'fasthtml.core._part_resp': ('api/core.html#_part_resp', 'fasthtml/core.py'),
+                               'fasthtml.core._path_index': ('api/core.html#_path_index', 'fasthtml/core.py'),
+                               'fasthtml.core._plain_json': ('api/core.html#_plain_json', 'fasthtml/core.py'),
+                               'fasthtml.core._ps_plan': ('api/core.html#_ps_plan', 'fasthtml/core.py'),
+                               'fasthtml.core._resolve': ('api/core.html#_resolve', 'fasthtml/core.py'),
                                'fasthtml.core._resp': ('api/core.html#_resp', 'fasthtml/core.py'),
+                               'fasthtml.core._respond_wrapped': ('api/core.html#_respond_wrapped', 'fasthtml/core.py'),
+                               'fasthtml.core._route_key': ('api/core.html#_route_key', 'fasthtml/core.py'),
                                'fasthtml.core._route_pn': ('api/core.html#_route_pn', 'fasthtml/core.py'),
+                               'fasthtml.core._run_before': ('api/core.html#_run_before', 'fasthtml/core.py'),
+                               'fasthtml.core._scope_host': ('api/core.html#_scope_host', 'fasthtml/core.py'),
+                               'fasthtml.core._send_getter': ('api/core.html#_send_getter', 'fasthtml/core.py'),
                                'fasthtml.core._send_ws': ('api/core.html#_send_ws', 'fasthtml/core.py'),
+                               'fasthtml.core._sess_getter': ('api/core.html#_sess_getter', 'fasthtml/core.py'),
+                               'fasthtml.core._shell_body': ('api/core.html#_shell_body', 'fasthtml/core.py'),
+                               'fasthtml.core._shell_page': ('api/core.html#_shell_page', 'fasthtml/core.py'),
+                               'fasthtml.core._skip_re': ('api/core.html#_skip_re', 'fasthtml/core.py'),
+                               'fasthtml.core._std_dumps': ('api/core.html#_std_dumps', 'fasthtml/core.py'),
+                               'fasthtml.core._streams': ('api/core.html#_streams', 'fasthtml/core.py'),
+                               'fasthtml.core._target_attrs': ('api/core.html#_target_attrs', 'fasthtml/core.py'),
                                'fasthtml.core._to_htmx_header': ('api/core.html#_to_htmx_header', 'fasthtml/core.py'),
                                'fasthtml.core._to_xml': ('api/core.html#_to_xml', 'fasthtml/core.py'),
                                'fasthtml.core._url_for': ('api/core.html#_url_for', 'fasthtml/core.py'),
+                               'fasthtml.core._uses_data': ('api/core.html#_uses_data', 'fasthtml/core.py'),
                                'fasthtml.core._vhash': ('api/core.html#_vhash', 'fasthtml/core.py'),
                                'fasthtml.core._wait_disconnect': ('api/core.html#_wait_disconnect', 'fasthtml/core.py'),
+                               'fasthtml.core._wrap_body': ('api/core.html#_wrap_body', 'fasthtml/core.py'),
                                'fasthtml.core._wrap_call': ('api/core.html#_wrap_call', 'fasthtml/core.py'),
                                'fasthtml.core._wrap_ex': ('api/core.html#_wrap_ex', 'fasthtml/core.py'),
                                'fasthtml.core._wrap_req': ('api/core.html#_wrap_req', 'fasthtml/core.py'),
                                'fasthtml.core._wrap_ws': ('api/core.html#_wrap_ws', 'fasthtml/core.py'),
                                'fasthtml.core._ws_endp': ('api/core.html#_ws_endp', 'fasthtml/core.py'),
                                'fasthtml.core._xt_cts': ('api/core.html#_xt_cts', 'fasthtml/core.py'),
+                               'fasthtml.core._xt_stream': ('api/core.html#_xt_stream', 'fasthtml/core.py'),
+                               'fasthtml.core._zstd_enc': ('api/core.html#_zstd_enc', 'fasthtml/core.py'),
                                'fasthtml.core.add_sig_param': ('api/core.html#add_sig_param', 'fasthtml/core.py'),
+                               'fasthtml.core.asset_manifest': ('api/core.html#asset_manifest', 'fasthtml/core.py'),
                                'fasthtml.core.cancel_on_disconnect': ('api/core.html#cancel_on_disconnect', 'fasthtml/core.py'),
                                'fasthtml.core.cookie': ('api/core.html#cookie', 'fasthtml/core.py'),
                                'fasthtml.core.decode_uri': ('api/core.html#decode_uri', 'fasthtml/core.py'),
@@ -162,6 +322,8 @@ d = { 'settings': { 'branch': 'main',
                                'fasthtml.core.reg_re_param': ('api/core.html#reg_re_param', 'fasthtml/core.py'),
                                'fasthtml.core.respond': ('api/core.html#respond', 'fasthtml/core.py'),
                                'fasthtml.core.serve': ('api/core.html#serve', 'fasthtml/core.py'),
+                               'fasthtml.core.set_json_backend': ('api/core.html#set_json_backend', 'fasthtml/core.py'),
+                               'fasthtml.core.set_vurl_manifest': ('api/core.html#set_vurl_manifest', 'fasthtml/core.py'),
                                'fasthtml.core.signal_shutdown': ('api/core.html#signal_shutdown', 'fasthtml/core.py'),
                                'fasthtml.core.snake2hyphens': ('api/core.html#snake2hyphens', 'fasthtml/core.py'),
                                'fasthtml.core.unqid': ('api/core.html#unqid', 'fasthtml/core.py'),
@@ -264,6 +426,7 @@ d = { 'settings': { 'branch': 'main',
                                'fasthtml.pico.PicoBusy': ('api/pico.html#picobusy', 'fasthtml/pico.py'),
                                'fasthtml.pico.Search': ('api/pico.html#search', 'fasthtml/pico.py'),
                                'fasthtml.pico.set_pico_cls': ('api/pico.html#set_pico_cls', 'fasthtml/pico.py')},
+            'fasthtml.sessions': {},
             'fasthtml.starlette': {},
             'fasthtml.stripe_otp': { 'fasthtml.stripe_otp.Payment': ('explains/stripe.html#payment', 'fasthtml/stripe_otp.py'),
                                      'fasthtml.stripe_otp._search_app': ('explains/stripe.html#_search_app', 'fasthtml/stripe_otp.py'),
@@ -325,6 +488,14 @@ d = { 'settings': { 'branch': 'main',
                                 'fasthtml.xtend.Now': ('api/xtend.html#now', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.On': ('api/xtend.html#on', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.Prev': ('api/xtend.html#prev', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.SSEChannel': ('api/xtend.html#ssechannel', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.SSEChannel.__init__': ('api/xtend.html#ssechannel.__init__', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.SSEChannel._deliver': ('api/xtend.html#ssechannel._deliver', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.SSEChannel.publish': ('api/xtend.html#ssechannel.publish', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.SSEChannel.response': ('api/xtend.html#ssechannel.response', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.SSEChannel.start': ('api/xtend.html#ssechannel.start', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.SSEChannel.stop': ('api/xtend.html#ssechannel.stop', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.SSEChannel.stream': ('api/xtend.html#ssechannel.stream', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.Script': ('api/xtend.html#script', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.ScriptX': ('api/xtend.html#scriptx', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.Socials': ('api/xtend.html#socials', 'fasthtml/xtend.py'),
@@ -333,6 +504,9 @@ d = { 'settings': { 'branch': 'main',
                                 'fasthtml.xtend.Surreal': ('api/xtend.html#surreal', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.Titled': ('api/xtend.html#titled', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.YouTubeEmbed': ('api/xtend.html#youtubeembed', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend._NoReq': ('api/xtend.html#_noreq', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend._NoReq.url_path_for': ('api/xtend.html#_noreq.url_path_for', 'fasthtml/xtend.py'),
+                                'fasthtml.xtend.cached_ft': ('api/xtend.html#cached_ft', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.clear': ('api/xtend.html#clear', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.double_braces': ('api/xtend.html#double_braces', 'fasthtml/xtend.py'),
                                 'fasthtml.xtend.jsd': ('api/xtend.html#jsd', 'fasthtml/xtend.py'),
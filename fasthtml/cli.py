@@ -1,12 +1,13 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/api/09_cli.ipynb.
 
 # %% auto #0
-__all__ = ['railway_link', 'railway_deploy']
+__all__ = ['railway_link', 'railway_deploy', 'build_manifest']
 
 # %% ../nbs/api/09_cli.ipynb #acfbc502
 from fastcore.utils import *
 from fastcore.script import call_parse, bool_arg
 from subprocess import check_output, run
+from .core import asset_manifest
 
 import json
 
@@ -51,3 +52,13 @@ def railway_deploy(
     railway_link.__wrapped__()
     if mount: _run(f"railway volume add -m /app/data".split())
     _run(f"railway up -c".split())
+
+# %% ../nbs/api/09_cli.ipynb #2b061885
+@call_parse
+def build_manifest(
+    root:str='.', # Directory of static files to hash
+    dest:str='manifest.json' # Where to save the manifest
+):
+    "Save a manifest of hashes of the static files under `root`, for `set_vurl_manifest`"
+    m = asset_manifest(root, dest=dest)
+    print(f'Hashed {len(m)} files to {dest}')
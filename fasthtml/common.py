@@ -8,5 +8,6 @@ from .basics import *
 from .authmw import *
 from .live_reload import *
 from .toaster import *
+from .sessions import *
 from .js import *
 from .fastapp import *
@@ -18,7 +18,7 @@ The decorated function doubles as a URL builder, so links never need hardcoded p
 
 Handlers return FT trees (from `fastcore.xml`), rendered as HTML automatically: a full page for regular requests, a bare fragment for HTMX requests. In a full page, top-level `Title`, `Meta`, `Link`, and `Style` items go in `<head>`; the rest goes in `<body>`. Strings are sent as HTML, dicts as JSON, and a Starlette `Response` is sent untouched. A return tuple may mix content with special items: any `HttpHeader` (e.g. from `cookie()` or `HtmxResponseHeaders()`) becomes a response header, any `BackgroundTask` runs after the response is sent, and the rest renders as content. `Redirect` picks the right redirect mechanism for HTMX vs regular requests, and `FtResponse` wraps FT content when you need the status code or headers.
 
-Handler parameters are filled from the request: each is looked up in path, cookie, header (snake_case names match Hyphen-Case headers), query, then form data, and cast by calling its annotation on the value. `bool`, `int`, and `date` get smart string parsing; `UploadFile` passes through. Repeated params take the last value unless annotated `list[T]`, which collects them all. A param with no annotation and no special name is ignored, with a warning. A dataclass, TypedDict, namedtuple, or any annotated class collects the whole form body; a `__from_request__` classmethod customizes construction. A missing required param is a 400, a failed cast a 404. These special names need no annotation:
+Handler parameters are filled from the request: each is looked up in path, cookie, header (snake_case names match Hyphen-Case headers), query, then form data, and cast by calling its annotation on the value. `bool`, `int`, and `date` get smart string parsing; `UploadFile` passes through, and an `UploadStream` param iterates a multipart body's parts as they arrive rather than buffering them. Repeated params take the last value unless annotated `list[T]`, which collects them all. A param with no annotation and no special name is ignored, with a warning. A dataclass, TypedDict, namedtuple, or any annotated class collects the whole form body; a `__from_request__` classmethod customizes construction. A missing required param is a 400, a failed cast a 404. These special names need no annotation:
 
     req, ws   the Request / WebSocket connection
     sess      session dict
@@ -47,12 +47,14 @@ Docs: https://www.fastht.ml/docs/api/core.html.md"""
 # %% auto #0
 __all__ = ['empty', 'htmx_hdrs', 'fh_cfg', 'htmx_resps', 'DEF_MAXPART', 'htmx_exts', 'htmxsrc', 'htmx4src', 'fhjsscr', 'surrsrc',
            'scopesrc', 'viewport', 'charset', 'cors_allow', 'iframe_scr', 'all_meths', 'devtools_loc', 'parsed_date',
-           'snake2hyphens', 'HtmxHeaders', 'HttpHeader', 'HtmxResponseHeaders', 'form2dict', 'parse_form', 'ApiReturn',
-           'JSONResponse', 'flat_xt', 'Beforeware', 'EventStream', 'signal_shutdown', 'uri', 'decode_uri', 'flat_tuple',
-           'noop_body', 'respond', 'is_full_page', 'Redirect', 'get_key', 'qp', 'def_hdrs', 'Lifespan', 'FastHTML',
-           'HostRoute', 'nested_name', 'serve', 'until_disconnect', 'cancel_on_disconnect', 'Client', 'RouteFuncs',
-           'APIRouter', 'cookie', 'reg_re_param', 'StaticNoCache', 'StaticImmutable', 'vurl', 'add_sig_param', 'into',
-           'MiddlewareBase', 'FtResponse', 'unqid']
+           'snake2hyphens', 'HtmxHeaders', 'HttpHeader', 'HtmxResponseHeaders', 'form2dict', 'set_json_backend',
+           'parse_form', 'UploadPart', 'UploadStream', 'ApiReturn', 'JSONResponse', 'flat_xt', 'Beforeware',
+           'EventStream', 'signal_shutdown', 'uri', 'decode_uri', 'flat_tuple', 'noop_body', 'respond', 'is_full_page',
+           'Redirect', 'get_key', 'qp', 'def_hdrs', 'Lifespan', 'HostRoute', 'IndexedRouter', 'FastHTML', 'HttpCache',
+           'nested_name', 'ResponseCache', 'serve', 'until_disconnect', 'cancel_on_disconnect', 'Client', 'RouteFuncs',
+           'APIRouter', 'cookie', 'reg_re_param', 'StaticCache', 'StaticNoCache', 'StaticImmutable', 'vurl',
+           'asset_manifest', 'set_vurl_manifest', 'CompressMiddleware', 'add_sig_param', 'into', 'MiddlewareBase',
+           'FtResponse', 'StreamingFtResponse', 'unqid', 'LocalBroadcast', 'UnixBroadcast', 'WSHub']
 
 # %% ../nbs/api/00_core.ipynb #23503b9e
 import json,uuid,inspect,types,asyncio,inspect,random,contextlib,itsdangerous,hashlib
@@ -67,8 +69,8 @@ from types import UnionType, SimpleNamespace as ns, GenericAlias
 from typing import get_args, get_origin, Union, Mapping, List, Any, Callable
 from datetime import datetime,date
 from dataclasses import dataclass
-from inspect import Parameter,get_annotations
-from functools import partialmethod, update_wrapper
+from inspect import Parameter,get_annotations,isawaitable
+from functools import partialmethod, update_wrapper, lru_cache
 from http import cookies
 from urllib.parse import urlencode, parse_qs, quote, unquote, urlsplit, urlunsplit
 from copy import deepcopy
@@ -78,6 +80,9 @@ from anyio import from_thread
 from uuid import uuid4, UUID
 from base64 import b64encode,b64decode
 from email.utils import format_datetime
+from tempfile import SpooledTemporaryFile, gettempdir
+from python_multipart.multipart import parse_options_header
+import python_multipart
 
 from .starlette import *
 
@@ -137,27 +142,19 @@ def _check_anno(arg, anno):
     if isinstance(anno, type) and not get_origin(anno) and issubclass(anno, (list, tuple)) and not _is_body(anno): return f"`{arg}` uses bare `{anno.__name__}` annotation, so is ignored (use e.g. `{anno.__name__}[str]` instead)."
 
 # %% ../nbs/api/00_core.ipynb #0afb520c
-def _fix_anno(t, o):
-    "Create appropriate callable type for casting a `str` to type `t` (or first type in `t` if union)"
+_anno_casts = {bool: str2bool, int: str2int, date: str2date, UploadFile: noop}
+
+def _anno_caster(t):
+    "Compile the cast for type `t` (or first type in `t` if union) into a function of the request value"
     origin = get_origin(t)
     if origin is Union or origin is UnionType: origin = get_origin(t:=first(o for o in get_args(t) if o!=type(None)))
-    if origin in (list,List): t = first(o for o in get_args(t) if o!=type(None))
-    d = {bool: str2bool, int: str2int, date: str2date, UploadFile: noop}
-    res = d.get(t, t)
-    if origin in (list,List): return _mk_list(res, o)
-    if isinstance(t, type) and issubclass(t, (list,tuple)): return None
-    if not isinstance(o, (str,list,tuple)): return o
-    return res(o[-1]) if isinstance(o,(list,tuple)) else res(o)
-
-# %% ../nbs/api/00_core.ipynb #c58ccadb
-def _form_arg(k, v, d):
-    "Get type by accessing key `k` from `d`, and use to cast `v`"
-    if v is None: return
-    if not isinstance(v, (str,list,tuple)): return v
-    # This is the type we want to cast `v` to
-    anno = d.get(k, None)
-    if not anno: return v
-    return _fix_anno(anno, v)
+    if origin in (list,List): return partial(_mk_list, _anno_casts.get(t:=first(o for o in get_args(t) if o!=type(None)), t))
+    if isinstance(t, type) and issubclass(t, (list,tuple)): return lambda o: None
+    res = _anno_casts.get(t, t)
+    def _f(o):
+        if not isinstance(o, (str,list,tuple)): return o
+        return res(o[-1]) if isinstance(o,(list,tuple)) else res(o)
+    return _f
 
 # %% ../nbs/api/00_core.ipynb #5fc04751
 @dataclass
@@ -203,6 +200,67 @@ def form2dict(form: FormData) -> dict:
 # %% ../nbs/api/00_core.ipynb #8899bc0a
 DEF_MAXPART = 100*1024*1024
 
+# %% ../nbs/api/00_core.ipynb #68491dfb
+def _json_default(o): return list(o) if is_listy(o) else str(o)
+
+def _std_dumps(o):
+    return json.dumps(o, ensure_ascii=False, allow_nan=False, indent=None, separators=(",",":"), default=_json_default).encode("utf-8")
+
+_json_leaves = {str,int,bool,type(None)}
+def _plain_json(o):
+    "Whether `o` holds only types `msgspec` encodes like `json`: no enums, datetimes, dataclasses, subclasses, or NaN/inf"
+    t = type(o)
+    if t is dict: o = o.values()
+    elif t is not list and t is not tuple: return t in _json_leaves or (t is float and o-o==0)
+    for v in o:
+        t = type(v)
+        if t in _json_leaves: continue
+        if t is float:
+            if v-v==0: continue  # NaN and inf give NaN
+            return False
+        if not _plain_json(v): return False
+    return True
+
+def _orjson_default(o):
+    "`_json_default`, except for subclasses of JSON types, which `json` encodes itself, so `orjson` gives up and `_dumps` falls back to it"
+    if isinstance(o, (str,int,float,list,tuple,dict)): raise TypeError
+    return _json_default(o)
+
+def _orjson_backend():
+    import orjson
+    opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    def _dumps(o):
+        try: return orjson.dumps(o, default=_orjson_default, option=opts)
+        except orjson.JSONEncodeError: return _std_dumps(o)  # e.g. ints beyond 64 bits, or subclasses
+    return _dumps,orjson.loads
+
+def _msgspec_backend():
+    import msgspec
+    enc,dec = msgspec.json.Encoder(enc_hook=_json_default),msgspec.json.Decoder()
+    def _dumps(o):
+        if not _plain_json(o): return _std_dumps(o)
+        try: return enc.encode(o)
+        except (TypeError, msgspec.EncodeError): return _std_dumps(o)
+    def _loads(s):
+        try: return dec.decode(s)
+        except msgspec.DecodeError as e: raise ValueError(str(e)) from None
+    return _dumps,_loads
+
+_json_backends = dict(orjson=_orjson_backend, msgspec=_msgspec_backend, json=lambda: (_std_dumps,json.loads))
+_json = AttrDict()
+
+def set_json_backend(name=None):
+    "Encode and decode JSON with `name` (`orjson`, `msgspec`, or `json`), or the first of those installed if `None`"
+    for nm in [name] if name else _json_backends:
+        try: _json.dumps,_json.loads = _json_backends[nm]()
+        except ImportError:
+            if name: raise
+            continue
+        fh_cfg['json'] = nm
+        return nm
+
+set_json_backend()
+
 # %% ../nbs/api/00_core.ipynb #42c9cea0
 async def parse_form(req: Request) -> FormData:
     "Starlette errors on empty multipart/json forms, so this checks for that situation"
@@ -214,23 +272,134 @@ async def parse_form(req: Request) -> FormData:
         if int(req.headers.get("Content-Length", "0")) <= len(boundary) + 6: return FormData()
         return await req.form(max_part_size=maxpart)
     body = await req.body()  # Cache body for non-multipart request types
-    if ctype == 'application/json': return await req.json() if body else {}
+    if ctype == 'application/json': return _json.loads(body) if body else {}
     return await req.form(max_part_size=maxpart)
 
+# %% ../nbs/api/00_core.ipynb #f207e409
+class UploadPart:
+    "A part of an `UploadStream`: iterate for its bytes as they arrive, or `read`, `text`, `spool` or `save` it"
+    def __init__(self, stream, headers):
+        self.stream,self.headers,self.size,self.done = stream,headers,0,False
+        _,opts = parse_options_header(headers.get('content-disposition', ''))
+        self.name = opts.get(b'name', b'').decode()
+        self.filename = fn.decode() if (fn := opts.get(b'filename')) is not None else None
+        self.content_type = headers.get('content-type')
+        self.hasher = hashlib.new(stream.hash) if stream.hash else None
+
+    @property
+    def digest(self): return self.hasher.hexdigest() if self.hasher else None
+
+    def __repr__(self): return f"UploadPart(name={self.name!r}, filename={self.filename!r}, size={self.size})"
+
+    async def __aiter__(self):
+        while not self.done:
+            ev,d = await anext(self.stream._evs)
+            if ev=='end': self.done = True
+            elif d:
+                self.size += len(d)
+                if self.size > self.stream.max_part_size: raise HTTPException(413, f"Part too large: {self.name}")
+                if self.hasher: self.hasher.update(d)
+                yield d
+
+    async def read(self): return b''.join([o async for o in self])
+    async def text(self, encoding='utf-8'): return (await self.read()).decode(encoding)
+    async def drain(self):
+        async for _ in self: pass
+
+    async def spool(self):
+        "Read the rest of the part into an `UploadFile`, kept in memory up to the stream's `spool_size` then in a tempfile"
+        f = UploadFile(SpooledTemporaryFile(max_size=self.stream.spool_size), size=0, filename=self.filename, headers=Headers(self.headers))
+        async for o in self: await f.write(o)
+        await f.seek(0)
+        return f
+
+    async def save(self, path):
+        "Write the rest of the part to `path` as it arrives, returning its size"
+        f = await run_in_threadpool(open, path, 'wb')
+        try:
+            async for o in self: await run_in_threadpool(f.write, o)
+        finally: await run_in_threadpool(f.close)
+        return self.size
+
+# %% ../nbs/api/00_core.ipynb #eff42915
+class UploadStream:
+    "Request param: iterate for a multipart body's `UploadPart`s as they arrive, instead of buffering the form"
+    max_size,max_part_size,spool_size,hash = None,None,1024*1024,None
+    def __init__(self, req):
+        self.req,self.received,self._part = req,0,None
+        if self.max_part_size is None: self.max_part_size = getattr(req, 'max_part_size', DEF_MAXPART)
+        self._evs = self._events()
+
+    @classmethod
+    def config(cls, max_size=None, max_part_size=None, spool_size=1024*1024, hash=None):
+        "A subclass to annotate a route's param with: `max_size` and `max_part_size` bytes (else 413), `spool_size`, and a `hashlib` name"
+        return type(cls.__name__, (cls,), dict(max_size=max_size, max_part_size=max_part_size, spool_size=spool_size, hash=hash))
+
+    async def _events(self):
+        "Parse the body as it's read, yielding `('part', headers)`, `('data', bytes)`, and `('end', None)` for each part"
+        ctype,opts = parse_options_header(self.req.headers.get('content-type', ''))
+        if ctype!=b'multipart/form-data' or b'boundary' not in opts: raise HTTPException(400, "Invalid form-data: no boundary")
+        evs,hdrs,fld,val = [],{},bytearray(),bytearray()
+        def _hdr_end():
+            hdrs[fld.decode('latin-1').lower()] = val.decode('latin-1')
+            fld.clear(); val.clear()
+        def _hdrs_done():
+            evs.append(('part', dict(hdrs)))
+            hdrs.clear()
+        parser = python_multipart.MultipartParser(opts[b'boundary'], dict(
+            on_header_field=lambda d,s,e: fld.extend(d[s:e]), on_header_value=lambda d,s,e: val.extend(d[s:e]),
+            on_header_end=_hdr_end, on_headers_finished=_hdrs_done,
+            on_part_data=lambda d,s,e: evs.append(('data', d[s:e])), on_part_end=lambda: evs.append(('end', None))))
+        try:
+            async for chunk in self.req.stream():
+                self.received += len(chunk)
+                if self.max_size is not None and self.received > self.max_size: raise HTTPException(413, "Upload too large")
+                parser.write(chunk)
+                for o in evs: yield o
+                evs.clear()
+            parser.finalize()
+        except python_multipart.exceptions.MultipartParseError as e: raise HTTPException(400, f"Invalid form-data: {e}") from None
+        for o in evs: yield o
+
+    async def __aiter__(self):
+        while True:
+            if self._part: await self._part.drain()  # skip whatever the handler didn't read
+            if (ev := await anext(self._evs, None)) is None: return
+            self._part = UploadPart(self, ev[1])
+            yield self._part
+
+    async def form(self):
+        "The rest of the body as a dict, like `form2dict(await parse_form(req))`, but with files spooled per `spool_size`"
+        res = {}
+        async for p in self:
+            v = (await p.text()) if p.filename is None else (await p.spool())
+            res[p.name] = [*res[p.name], v] if isinstance(res.get(p.name), list) else [res[p.name], v] if p.name in res else v
+        return res
+
 # %% ../nbs/api/00_core.ipynb #0caedd04
+def _field_caster(anno):
+    "Compile the cast of a form field value to type `anno`, leaving values that aren't strings or lists as they are"
+    if not anno: return noop
+    cast = _anno_caster(anno)
+    return lambda v: cast(v) if isinstance(v, (str,list,tuple)) else v
+
+@lru_cache(maxsize=1024)
+def _body_decoder(anno):
+    "Compile a `(conn, data)` function creating an `anno` from form `data`, so its fields and casts are worked out once per type"
+    if (ctor := getattr(anno, '__from_request__', None)):
+        plan = _ps_plan({k:v for k,v in _params(ctor).items() if k != 'cls'})
+        async def _dec(conn, data): return await maybe_await(ctor(**await _find_ps(conn, data, conn.headers, plan)))
+        return _dec
+    flds = tuple((k, _field_caster(a)) for k,a in _annotations(anno).items())
+    if not flds: return lambda conn,data: anno(**data)
+    def _dec(conn, data): return anno(**{k: None if v is None else cast(v) for k,cast in flds if (v := data.get(k, empty)) is not empty})
+    return _dec
+
 async def _from_body(conn, p, data):
     "Create an instance of the annotated type from pre-parsed `data`"
-    anno = p.annotation
     # param params take precedence
     data = dict(data) | getattr(conn, 'path_params', {})
-    ctor = getattr(anno, '__from_request__', None)
-    if ctor:
-        ps = {k:v for k,v in _params(ctor).items() if k != 'cls'}
-        kwargs = await _find_ps(conn, data, conn.headers, ps)
-        return await maybe_await(ctor(**kwargs))
-    d = _annotations(anno)
-    cargs = {k: _form_arg(k, v, d) for k, v in data.items() if not d or k in d}
-    return anno(**cargs)
+    return await maybe_await(_body_decoder(p.annotation)(conn, data))
 
 # %% ../nbs/api/00_core.ipynb #88b6da3f
 class ApiReturn:
@@ -244,69 +413,122 @@ class ApiReturn:
 # %% ../nbs/api/00_core.ipynb #7cc39ba9
 class JSONResponse(JSONResponseOrig):
     "Same as starlette's version, but auto-stringifies non serializable types"
-    def render(self, content:Any)->bytes:
-        def _default(o): return list(o) if is_listy(o) else str(o)
-        res = json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",",":"), default=_default)
-        return res.encode("utf-8")
+    def render(self, content:Any)->bytes: return _json.dumps(content)
 
 
 # %% ../nbs/api/00_core.ipynb #5fa96e3a
-async def _find_p(conn, data, hdrs, arg:str, p:Parameter):
-    "In `data` find param named `arg` of type in `p` (`arg` is ignored for body types)"
+def _sess_getter(conn, data, hdrs): return conn.scope.get('session', {})
+
+def _send_getter(conn, data, hdrs):
+    assert not isinstance(conn, Request), "`send` requires a websocket, not a `Request`"
+    return partial(_send_ws, conn)
+
+async def _body_getter(conn, data, hdrs): return (await conn.body()).decode()
+def _attr_getter(o): return lambda conn,data,hdrs: getattr(conn, o)
+
+def _uses_data(g, v=True):
+    "Mark getter `g` as reading form/JSON `data`: always if `v`, or only when nothing else has the value if `v` is `None`"
+    g.uses_data = v
+    return g
+
+_name_getters = dict(
+    ws=lambda conn,data,hdrs: conn, scope=lambda conn,data,hdrs: conn.scope, data=_uses_data(lambda conn,data,hdrs: data),
+    htmx=lambda conn,data,hdrs: _get_htmx(hdrs), app=lambda conn,data,hdrs: conn.scope['app'],
+    state=lambda conn,data,hdrs: conn.scope['app'].state, auth=lambda conn,data,hdrs: conn.scope.get('auth', None),
+    send=_send_getter, api=lambda conn,data,hdrs: ApiReturn(hdrs.get('accept')=='application/json'), body=_body_getter,
+    **{o:_attr_getter(o) for o in ('hdrs','ftrs','bodykw','htmlkw')})
+
+def _name_getter(nm):
+    "Getter for a special param name with no annotation"
+    if 'request'.startswith(nm): return _name_getters['ws']
+    if 'session'.startswith(nm): return _sess_getter
+    return _name_getters.get(nm, lambda conn,data,hdrs: None)
+
+def _anno_getter(anno, arg, p):
+    "Getter for a special annotation type, or `None` if `anno` isn't one"
+    if not isinstance(anno, type) or isinstance(anno, GenericAlias): return
+    if issubclass(anno, HtmxHeaders): return lambda conn,data,hdrs: _get_htmx(hdrs)
+    if issubclass(anno, UploadStream):
+        g = lambda conn,data,hdrs: anno(conn)
+        g.streams = True
+        return g
+    if issubclass(anno, Starlette): return lambda conn,data,hdrs: conn.scope['app']
+    if issubclass(anno, HTTPConnection): return lambda conn,data,hdrs: conn
+    if issubclass(anno, State): return lambda conn,data,hdrs: conn.scope['app'].state
+    if anno is dict: return _uses_data(lambda conn,data,hdrs: data)
+    if _is_body(anno):
+        if 'session'.startswith(arg.lower()): return _sess_getter
+        return _uses_data(lambda conn,data,hdrs: _from_body(conn, p, data))
+
+def _param_getter(arg:str, p:Parameter):
+    "Compile a `(conn, data, hdrs)` getter for param named `arg` of type in `p`, so annotation dispatch happens once per handler"
     anno = p.annotation
-    # Special annotation types
-    if isinstance(anno, type) and not isinstance(anno, GenericAlias):
-        if issubclass(anno, HtmxHeaders): return _get_htmx(hdrs)
-        if issubclass(anno, Starlette): return conn.scope['app']
-        if issubclass(anno, HTTPConnection): return conn
-        if issubclass(anno, State): return conn.scope['app'].state
-        if anno is dict: return data
-        if _is_body(anno):
-            if 'session'.startswith(arg.lower()): return conn.scope.get('session', {})
-            return await _from_body(conn, p, data)
-    if (msg := _check_anno(arg, anno)): return warn(msg)
-    # Special param names with no annotations
-    if anno is empty:
-        if arg.lower()=='ws' or 'request'.startswith(arg.lower()): return conn
-        if 'session'.startswith(arg.lower()): return conn.scope.get('session', {})
-        if arg.lower()=='scope': return conn.scope
-        if arg.lower()=='data': return data
-        if arg.lower()=='htmx': return _get_htmx(hdrs)
-        if arg.lower()=='app': return conn.scope['app']
-        if arg.lower()=='state': return conn.scope['app'].state
-        if arg.lower()=='auth': return conn.scope.get('auth', None)
-        if arg.lower()=='send':
-            assert not isinstance(conn, Request), "`send` requires a websocket, not a `Request`"
-            return partial(_send_ws, conn)
-        if arg.lower()=='api': return ApiReturn(hdrs.get('accept')=='application/json')
-        if arg.lower()=='body': return (await conn.body()).decode()
-        if arg.lower() in ('hdrs','ftrs','bodykw','htmlkw'): return getattr(conn, arg.lower())
-        return None
+    if (g := _anno_getter(anno, arg, p)): return g
+    if (msg := _check_anno(arg, anno)): return lambda conn,data,hdrs: warn(msg)
+    if anno is empty: return _name_getter(arg.lower())
     # Not a special name or a special annotation
-    res = conn.path_params.get(arg, None)
-    if res in (empty,None): res = conn.cookies.get(arg, None)
-    if res in (empty,None): res = hdrs.get(snake2hyphens(arg), None)
-    if res in (empty,None): res = conn.query_params.getlist(arg)
-    if res==[]: res = None
-    if res in (empty,None): res = data.get(arg, None)
-    if res in (empty,None) and isinstance(vals := data.get('values'), dict): res = vals.get(arg)  # htmx v4 nests form data under `values`
-    if res in (empty,None):
-        if p.default is empty:
-            if isinstance(conn, Request): raise HTTPException(400, f"Missing required field: {arg}")
-            raise ValueError(f"Missing required field: {arg}")
-        res = p.default
-    try: return _fix_anno(anno, res)
-    except ValueError as e:
-        if isinstance(conn, Request): raise HTTPException(404, f"{conn.url.path}: {e}") from None
-        raise
+    hnm,cast,default = snake2hyphens(arg),_anno_caster(anno),p.default
+    def _g(conn, data, hdrs):
+        res = conn.path_params.get(arg, None)
+        if res in (empty,None): res = conn.cookies.get(arg, None)
+        if res in (empty,None): res = hdrs.get(hnm, None)
+        if res in (empty,None): res = conn.query_params.getlist(arg)
+        if res==[]: res = None
+        if res in (empty,None): res = data.get(arg, None)
+        if res in (empty,None) and isinstance(vals := data.get('values'), dict): res = vals.get(arg)  # htmx v4 nests form data under `values`
+        if res in (empty,None):
+            if default is empty:
+                if isinstance(conn, Request): raise HTTPException(400, f"Missing required field: {arg}")
+                raise ValueError(f"Missing required field: {arg}")
+            res = default
+        try: return cast(res)
+        except ValueError as e:
+            if isinstance(conn, Request): raise HTTPException(404, f"{conn.url.path}: {e}") from None
+            raise
+    return _uses_data(_g, None)
 
 # %% ../nbs/api/00_core.ipynb #bf42edad
+class _Plan(tuple):
+    "`(arg, getter)` pairs, with `uses_data` true if any getter needs form/JSON data, `None` if only as a fallback"
+    uses_data = False
+
+def _ps_plan(params):
+    "Compile `params` into a tuple of `(arg, getter)` pairs, run per request by `_find_ps`"
+    res = _Plan((arg, _param_getter(arg, p)) for arg,p in params.items())
+    uses = [getattr(g, 'uses_data', False) for _,g in res]
+    if any(getattr(g, 'streams', False) for _,g in res):
+        # The body is the `UploadStream`'s to read, so other params only come from the path, query, headers, cookies or defaults
+        if True in uses: raise TypeError(f"An `UploadStream` can't be combined with params read from the form body: {[a for a,g in res if getattr(g, 'uses_data', False)]}")
+    elif True in uses: res.uses_data = True
+    elif None in uses: res.uses_data = None
+    return res
+
 async def _find_ps(conn, data, hdrs, params):
+    "Find all `params` (a signature's parameters, or a `_ps_plan` of them)"
     if conn.query_params: data |= dict(conn.query_params)
-    return {arg:await _find_p(conn, data, hdrs, arg, p) for arg,p in params.items()}
+    if not isinstance(params, tuple): params = _ps_plan(params)
+    res = {}
+    for arg,g in params:
+        v = g(conn, data, hdrs)
+        res[arg] = (await v) if isawaitable(v) else v
+    return res
 
 # %% ../nbs/api/00_core.ipynb #090f1f0f
+class _NeedsData(Exception): pass
+
+class _NoData(dict):
+    "Stand-in for form/JSON data that raises `_NeedsData` when a key is missing, so the body is only parsed if a param needs it"
+    def get(self, k, default=None):
+        if k in self: return self[k]
+        raise _NeedsData(k)
+
 async def _wrap_req(req, params):
+    "Find `params` for `req`, reading and parsing the body only if a param can come from it"
+    if not isinstance(params, _Plan): params = _ps_plan(params)
+    if params.uses_data is False: return await _find_ps(req, {}, req.headers, params)
+    if params.uses_data is None:
+        try: return await _find_ps(req, _NoData(), req.headers, params)
+        except _NeedsData: pass
     data = form2dict(await parse_form(req))
     return await _find_ps(req, data, req.headers, params)
 
@@ -321,15 +543,59 @@ def flat_xt(lst):
     return tuple(result)
 
 # %% ../nbs/api/00_core.ipynb #aacff5ac
+class _AnyRe:
+    "Patterns matched one at a time, for `skip` lists that can't be joined into one regex"
+    def __init__(self, rs): self.rs = rs
+    def fullmatch(self, s): return any(r.fullmatch(s) for r in self.rs)
+
+def _skip_re(pats):
+    "Compile `pats` into one alternation if none has groups or inline flags, which joining would break, else into an `_AnyRe`"
+    if not pats: return None
+    rs,dflt = [re.compile(o) for o in pats],re.compile('').flags
+    if all(r.groups==0 and r.flags==dflt for r in rs): return re.compile('|'.join(f'(?:{o})' for o in pats))
+    return _AnyRe(rs)
+
 class Beforeware:
     "Wrap a `before` function with `skip` path patterns that bypass it"
-    def __init__(self, f, skip=None): self.f,self.skip = f,skip or []
+    def __init__(self, f, skip=None): self.f,self.skip,self._skip_c = f,skip or [],(None,None)
+    @property
+    def skip_re(self):
+        "`skip` compiled by `_skip_re`, recompiled whenever `skip` is reassigned or changed in place"
+        if (k := tuple(self.skip)) != self._skip_c[0]: self._skip_c = k,_skip_re(k)
+        return self._skip_c[1]
     def __repr__(self): return f'Beforeware({self.f}, skip={self.skip})'
 
 # %% ../nbs/api/00_core.ipynb #78c3c357
 async def _handle(f, /, *args, **kwargs):
     return (await f(*args, **kwargs)) if is_async_callable(f) else await run_in_threadpool(f, *args, **kwargs)
 
+# %% ../nbs/api/00_core.ipynb #6e11a5af
+_lazy_typs = (types.GeneratorType,map,filter)
+
+def _is_lazy(o): return isinstance(o, _lazy_typs) or hasattr(o, '__aiter__') or hasattr(o, '__await__')
+
+def _has_lazy(o, deep=True):
+    "Does `o` contain any generators, async iterables or awaitables, at any depth (but not inside FT components unless `deep`)?"
+    if isinstance(o, str): return False
+    if isinstance(o, FT): return deep and any(_has_lazy(c, deep) for c in o.children)
+    if isinstance(o, (tuple,list,L)): return any(_has_lazy(c, deep) for c in o)
+    return _is_lazy(o)
+
+async def _resolve(o, deep=True):
+    "Replace the awaitables and (async) generators in `o` with their results, resolving independent ones concurrently"
+    if getattr(type(o), 'resolve_content', False): o.content = await _resolve(o.content, deep)
+    if not _has_lazy(o, deep): return o
+    if hasattr(o, '__await__'): return await _resolve(await o, deep)
+    if hasattr(o, '__aiter__'): return await _resolve(tuple([x async for x in o]), deep)
+    if isinstance(o, _lazy_typs): return await _resolve(tuple(o), deep)
+    if isinstance(o, FT):
+        o.children = await _resolve(o.children)
+        return o
+    res,idxs = list(o),[i for i,x in enumerate(o) if _has_lazy(x, deep)]
+    for i,v in zip(idxs, await asyncio.gather(*(_resolve(o[i], deep) for i in idxs))): res[i] = v
+    if hasattr(o, '_fields'): return type(o)(*res)  # namedtuple
+    return type(o)(res)
+
 # %% ../nbs/api/00_core.ipynb #ad0f0e87
 async def _wrap_ws(ws, data, params):
     raw = data.pop('HEADERS', {}) or (data.pop('headers') if isinstance(data.get('headers'), dict) else {})  # htmx v4 sends lowercase `headers`
@@ -337,17 +603,37 @@ async def _wrap_ws(ws, data, params):
     return await _find_ps(ws, data, hdrs, params)
 
 # %% ../nbs/api/00_core.ipynb #dcc15129
+class _WSBatch:
+    "Buffer of fragments sent to `ws` as one frame `delay` seconds (0: one loop tick) after the first, keeping only the last per element id"
+    def __init__(self, ws, delay): self.ws,self.delay,self.parts,self.task = ws,delay,{},None
+
+    def add(self, resp):
+        for o in (resp if isinstance(resp, tuple) else (resp,)):
+            k = (isinstance(o, FT) and o.attrs.get('id')) or object()
+            self.parts.pop(k, None)
+            self.parts[k] = o
+        if not self.task: self.task = asyncio.create_task(self.flush())
+
+    async def flush(self):
+        await asyncio.sleep(self.delay)
+        parts,self.parts,self.task = self.parts,{},None
+        try: await self.ws.send_text(to_xml(tuple(parts.values()), indent=fh_cfg.indent))
+        except (WebSocketDisconnect, RuntimeError): pass
+
 async def _send_ws(ws, resp):
     if not resp: return
-    res = to_xml(resp, indent=fh_cfg.indent)
-    await ws.send_text(res)
+    resp = await _resolve(resp)
+    if (b := getattr(ws, '_fh_batch', None)): return b.add(resp)
+    await ws.send_text(to_xml(resp, indent=fh_cfg.indent))
 
-def _ws_endp(recv, conn=None, disconn=None):
+def _ws_endp(recv, conn=None, disconn=None, coalesce=None):
     cls = type('WS_Endp', (WebSocketEndpoint,), {"encoding":"text"})
+    plans = {h:_ps_plan(_params(h)) for h in (recv,conn,disconn) if h}
 
     async def _generic_handler(handler, ws, data=None):
+        if coalesce is not None and not hasattr(ws, '_fh_batch'): ws._fh_batch = _WSBatch(ws, coalesce)
         try:
-            wd = await _wrap_ws(ws, loads(data) if data else {}, _params(handler))
+            wd = await _wrap_ws(ws, _json.loads(data) if data else {}, plans[handler])
             resp = await _handle(handler, **wd)
             if resp: await _send_ws(ws, resp)
         except ValueError as e: await ws.send_text(str(e))
@@ -406,12 +692,26 @@ def to_string(self:StringConvertor, value: str) -> str:
     return value
 
 # %% ../nbs/api/00_core.ipynb #46614165
+def _app_url_path(app, name, params):
+    "`app.url_path_for(name, **params)`, memoised until `app`'s route table changes"
+    routes = app.router.routes
+    c = getattr(app, '_url_paths', None)
+    if c is None or c[0] is not routes or c[1]!=len(routes) or len(c[2])>=4096: c = app._url_paths = routes,len(routes),{}
+    key = name,*params.items()
+    try: lp = c[2].get(key)
+    except TypeError: return app.url_path_for(name, **params)
+    if lp is None: lp = c[2][key] = app.url_path_for(name, **params)
+    return lp
+
 @patch
 def url_path_for(self:HTTPConnection, name: str, **path_params):
-    lp = self.scope['app'].url_path_for(name, **path_params)
+    lp = _app_url_path(self.scope['app'], name, path_params)
     return URLPath(f"{self.scope['root_path']}{lp}", lp.protocol, lp.host)
 
 # %% ../nbs/api/00_core.ipynb #c1707d59
+try: from fastcore.xml import _to_attr, _escape, _block_tags
+except ImportError: _to_attr = None  # fastcore's internals have changed, so `_ft_xml` falls back to its public `to_xml`
+_ws_significant = getattr(sys.modules[FT.__module__], '_ws_significant', ())
 _verbs = dict(get='hx-get', post='hx-post', put='hx-put', delete='hx-delete', patch='hx-patch', link='href')
 
 def _url_for(req, t):
@@ -422,20 +722,90 @@ def _url_for(req, t):
     t,m,q = t.partition('?')
     return f"{req.url_path_for(t, **kw)}{m}{q}"
 
+def _target_attrs(req, attrs):
+    "`attrs`, with any route targets converted to URLs in the matching `hx-*` or `href` attributes"
+    if not attrs or attrs.keys().isdisjoint(_verbs): return attrs
+    attrs = dict(attrs)
+    for k,v in _verbs.items():
+        t = attrs.pop(k, None)
+        if t: attrs[v] = _url_for(req, t)
+    return attrs
+
+class _Lazy(Exception): "Raised by `_ft_xml` on reaching a lazy child, so its parent component can be deferred"
+
+def _lazy_leaf(req, o):
+    "Is `o` an awaitable or (async) generator, being rendered for a request that defers them?"
+    return type(o) is not str and _is_lazy(o) and '_fh_lazy' in getattr(req, '__dict__', ())
+
+class _Deferred(list):
+    "Parts `_ft_xml` deferred while rendering a response, and the random `mark` in their placeholders, which user text can't forge"
+    def __init__(self): super().__init__(); self.mark = os.urandom(8).hex()
+    def placeholder(self, i): return f'\x00{self.mark}:{i}\x00'
+    def pattern(self): return re.compile(rb'\x00' + self.mark.encode() + rb':(\d+)\x00')
+
+def _defer(req, o, lvl, indent):
+    "Record `o` in `req` to be resolved and rendered once the rest of the response is, returning its placeholder"
+    lz = req._fh_lazy
+    lz.append((o,lvl,indent))
+    return lz.placeholder(len(lz)-1)
+
 def _find_targets(req, resp):
-    "Find and convert route targets in response attributes to URLs"
-    if isinstance(resp, tuple):
+    "Convert route targets in the attributes of `resp` and its children to URLs, in place"
+    if isinstance(resp, (tuple,list,L)):
         for o in resp: _find_targets(req, o)
     if isinstance(resp, FT):
         for o in resp.children: _find_targets(req, o)
-        for k,v in _verbs.items():
-            t = resp.attrs.pop(k, None)
-            if t: resp.attrs[v] = _url_for(req, t)
-
-def _to_xml(req, resp, indent):
-    "Convert response to XML string with target URL resolution"
-    _find_targets(req, resp)
-    return to_xml(resp, indent=indent)
+        resp.attrs = _target_attrs(req, resp.attrs)
+
+def _ft_xml(req, elm, lvl, indent):
+    "fastcore's `_to_xml`, converting route targets to URLs as it goes"
+    if _to_attr is None:
+        _find_targets(req, elm)
+        return to_xml((elm,), lvl=lvl, indent=indent)  # in a tuple, so that strings are escaped
+    if elm is None: return ''
+    if not isinstance(elm, FT) or type(elm) is not FT:
+        if hasattr(elm, '__ft__'): elm = elm.__ft__()
+        if isinstance(elm, (tuple,L)): return ''.join(_ft_xml(req, o, lvl, indent) for o in elm)
+        if isinstance(elm, bytes): return elm.decode('utf-8')
+        if not isinstance(elm, FT):
+            if _lazy_leaf(req, elm): raise _Lazy()
+            return f'{_escape(elm)}'
+    tag,cs,attrs = elm.tag,elm.children,_target_attrs(req, elm.attrs)
+    if indent and (tag in _ws_significant or attrs.get('contenteditable')=='true'): indent = False
+    sp,nl = (' '*lvl,'\n') if indent and tag in _block_tags else ('','')
+    stag = tag
+    if attrs:
+        sattrs = ' '.join(_to_attr(k, v) for k,v in attrs.items() if v is not False and v is not None and (k=='_' or k[-1]!='_'))
+        if sattrs: stag += f' {sattrs}'
+    cltag = '' if elm.void_ else f'</{tag}>'
+    stag_ = f'<{stag}>' if stag else ''
+    if not cs: return f'{sp}{stag_}{nl}' if elm.void_ else f'{sp}{stag_}{cltag}{nl}'
+    if len(cs)==1 and not isinstance(cs[0], (list,tuple,L,FT)) and not hasattr(cs[0], '__ft__'):
+        if _lazy_leaf(req, cs[0]): return _defer(req, elm, lvl, indent)
+        return f'{sp}{stag_}{_escape(cs[0])}{cltag}{nl}'
+    try: res = f'{sp}{stag_}{nl}' + ''.join(_ft_xml(req, c, lvl+2 if indent else 0, indent) for c in cs)
+    except _Lazy: return _defer(req, elm, lvl, indent)
+    if not elm.void_: res += f'{sp}{cltag}{nl}'
+    return Safe(res)
+
+def _to_xml(req, resp, indent, lvl=0):
+    "Convert response to XML string with target URL resolution, in a single pass"
+    if isinstance(resp, (list,tuple,L,FT)) or hasattr(resp, '__ft__'):
+        try: return Safe(_ft_xml(req, resp, lvl, indent))
+        except _Lazy: return Safe(_defer(req, resp, lvl, indent))
+    if isinstance(resp, bytes): return Safe(resp.decode('utf-8'))
+    return Safe(resp or '')
+
+async def _fill_lazy(req, r, lazy):
+    "Resolve the `lazy` parts `_ft_xml` deferred while rendering response `r`, concurrently, and splice them into its body"
+    # Parts deferred inside a component that was itself deferred later aren't in the body; resolving it covers them
+    pat = lazy.pattern()
+    idxs = sorted({i for o in pat.findall(r.body) if (i := int(o)) < len(lazy)})
+    vals = await asyncio.gather(*(_resolve(lazy[i][0]) for i in idxs))
+    parts = {i:_ft_xml(req, v, *lazy[i][1:]).encode('utf-8') for i,v in zip(idxs, vals)}
+    r.body = pat.sub(lambda m: parts.get(int(m[1]), m[0]), r.body)
+    r.headers['content-length'] = str(len(r.body))
+    return r
 
 # %% ../nbs/api/00_core.ipynb #f1e3ed2d
 _iter_typs = (tuple,list,map,filter,range,types.GeneratorType)
@@ -456,15 +826,76 @@ def noop_body(c, req):
     "Default Body wrap function which just returns the content"
     return c
 
+# %% ../nbs/api/00_core.ipynb #0506232a
+_page_attrs = 'hdrs','ftrs','htmlkw','bodykw'
+
+def _page_attr(nm):
+    "Request property with a private copy of the app's page default `nm`, only made on first access"
+    def _get(self):
+        d = self.__dict__
+        if nm not in d:
+            v = deepcopy(self._page_defaults[_page_attrs.index(nm)])
+            d[nm] = listify(v) if nm in ('hdrs','ftrs') else v
+        return d[nm]
+    def _set(self, v): self.__dict__[nm] = v
+    return property(_get, _set)
+
+for o in _page_attrs: setattr(HTTPConnection, o, _page_attr(o))
+
 # %% ../nbs/api/00_core.ipynb #7f49728d
-def respond(req, heads, bdy):
-    "Default FT response creation function"
+@lru_cache(maxsize=None)
+def _nparams(f): return len(inspect.signature(f).parameters)
+
+def _wrap_body(req, bdy):
+    "Call the request's `body_wrap` on `bdy`, also passing `req` if it takes two params"
     body_wrap = getattr(req, 'body_wrap', noop_body)
-    params = inspect.signature(body_wrap).parameters
-    bw_args = (bdy, req) if len(params)>1 else (bdy,)
-    body = Body(body_wrap(*bw_args), *flat_xt(req.ftrs), **req.bodykw)
+    return body_wrap(bdy, req) if _nparams(body_wrap)>1 else body_wrap(bdy)
+
+def _respond_wrapped(req, heads, cs):
+    "`respond` for body content `cs` that has already been through `body_wrap`"
+    body = Body(cs, *flat_xt(req.ftrs), **req.bodykw)
     return Html(Head(*heads, *flat_xt(req.hdrs)), body, **req.htmlkw)
 
+def respond(req, heads, bdy):
+    "Default FT response creation function"
+    return _respond_wrapped(req, heads, _wrap_body(req, bdy))
+
+# %% ../nbs/api/00_core.ipynb #20e5d429
+_slot = ft('fh-slot')
+_shell_cache = {}
+
+def _page_shell(req, hdrs, ftrs, htmlkw, bodykw):
+    "`(prefix, middle, suffix)` of the full page around the head items and body content, and the number of `ftrs`; cached until the page defaults change"
+    key = id(hdrs),id(ftrs),id(htmlkw),id(bodykw),fh_cfg.indent,req.scope.get('root_path', '')
+    snap = tuple(hdrs),tuple(ftrs),tuple(htmlkw.items()),tuple(bodykw.items())
+    c = _shell_cache.get(key)
+    if c and c[0] is hdrs and c[1] is ftrs and c[2]==snap: return c[3]
+    page = deepcopy(Html(Head(_slot, *flat_xt(hdrs)), Body(_slot, *flat_xt(ftrs), **bodykw), **htmlkw))
+    res = *_to_xml(req, page, indent=fh_cfg.indent).split(to_xml(_slot)),len(flat_xt(ftrs))
+    if len(_shell_cache)>=64: _shell_cache.clear()
+    _shell_cache[key] = hdrs,ftrs,snap,res
+    return res
+
+def _shell_body(req, bdy):
+    "`bdy` passed through `body_wrap`, and the cached page shell `(prefix, middle, suffix)` to splice it into, or `None` if the shell can't be used"
+    cs = _wrap_body(req, bdy)
+    if isinstance(cs, (types.GeneratorType,map,filter)): cs = tuple(cs)
+    # Checked after `body_wrap`, which may have set the request's own page attrs
+    if '_page_defaults' not in req.__dict__ or any(o in req.__dict__ for o in _page_attrs): return cs,None
+    pre,mid,suf,nftrs = _page_shell(req, *req._page_defaults)
+    tcs = cs if isinstance(cs, tuple) else (cs,)
+    # A `Body` with one text child renders inline, so leave that (rare) case to `respond`
+    if len(tcs)+nftrs<2 and not (tcs and (isinstance(tcs[0], (list,tuple,L,FT)) or hasattr(tcs[0], '__ft__'))): return cs,None
+    return tcs,(pre,mid,suf)
+
+def _shell_page(req, heads, bdy):
+    "Render a full page, splicing `heads` and `bdy` into the cached page shell if it can be used"
+    cs,shell = _shell_body(req, bdy)
+    indent = fh_cfg.indent
+    if not shell: return _to_xml(req, _respond_wrapped(req, heads, cs), indent=indent)
+    pre,mid,suf = shell
+    return pre + _to_xml(req, tuple(heads), indent, lvl=4) + mid + _to_xml(req, cs, indent, lvl=4) + suf
+
 # %% ../nbs/api/00_core.ipynb #b2007479
 def is_full_page(req, resp):
     "Check if response should be rendered as full page or fragment"
@@ -494,16 +925,86 @@ def _canonical(req):
     url = str(getattr(req, 'canonical', req.url)).replace('http://', 'https://', 1)
     return [Link(rel="canonical", href=url)]
 
+def _page_parts(req, resp):
+    "Split `resp` into head items, with the default title and canonical link added, and body content"
+    heads,bdy = partition(resp, lambda o: getattr(o, 'tag', '') in ('title','meta','link','style','base'))
+    title = [] if any(getattr(o, 'tag', '')=='title' for o in heads) else [Title(req.app.title)]
+    return [*heads, *title, *_canonical(req)],bdy
+
 def _xt_cts(req, resp):
     "Extract content and headers, render as full page or fragment"
-    hdr_tags = 'title','meta','link','style','base'
     resp = tuplify(resp)
-    heads,bdy = partition(resp, lambda o: getattr(o, 'tag', '') in hdr_tags)
     if not is_full_page(req, resp):
-        title = [] if any(getattr(o, 'tag', '')=='title' for o in heads) else [Title(req.app.title)]
-        resp = respond(req, [*heads, *title, *_canonical(req)], bdy)
+        return _shell_page(req, *_page_parts(req, resp))
     return _to_xml(req, resp, indent=fh_cfg.indent)
 
+# %% ../nbs/api/00_core.ipynb #7851cc0d
+async def _aitems(o):
+    "Iterate over sync or async iterable `o`"
+    if hasattr(o, '__aiter__'):
+        async for x in o: yield x
+    else:
+        for x in o: yield x
+
+def _streams(o, nkids):
+    "Should `o` be rendered piece by piece, rather than in one go?"
+    return _has_lazy(o) or (isinstance(o, FT) and len(o.children)>nkids)
+
+async def _ft_chunks(req, elm, lvl=0, indent=True, nkids=64):
+    "Render `elm` as a series of XML strings, awaiting children and consuming (async) generators as they are reached"
+    if hasattr(elm, '__await__'): elm = await elm
+    if hasattr(elm, '__ft__'): elm = elm.__ft__()
+    if not _streams(elm, nkids):
+        yield _ft_xml(req, elm, lvl, indent)  # not `_to_xml`, which passes top-level strings through unescaped
+        return
+    if isinstance(elm, FT):
+        if indent and (elm.tag in _ws_significant or elm.attrs.get('contenteditable')=='true'): indent = False
+        # Render the tag around a placeholder child to get its open and close tags, with targets resolved
+        opn,cls = _to_xml(req, FT(elm.tag, (_slot,), dict(elm.attrs), void_=elm.void_), indent, lvl).split(to_xml(_slot))
+        items,lvl = elm.children,lvl+2 if indent else 0
+    else: opn,cls,items = '','',elm
+    yield opn
+    batch = []
+    async for o in _aitems(items):
+        if hasattr(o, '__ft__'): o = o.__ft__()
+        if _streams(o, nkids):
+            if batch: yield _to_xml(req, tuple(batch), indent, lvl)
+            batch = []
+            async for s in _ft_chunks(req, o, lvl, indent, nkids): yield s
+        else:
+            batch.append(o)
+            if len(batch)>=nkids:
+                yield _to_xml(req, tuple(batch), indent, lvl)
+                batch = []
+    if batch: yield _to_xml(req, tuple(batch), indent, lvl)
+    yield cls
+
+async def _buffered(chunks, size):
+    "Join the strings from async iterable `chunks` into pieces of at least `size` characters"
+    buf,n = [],0
+    async for s in chunks:
+        buf.append(s)
+        n += len(s)
+        if n>=size:
+            yield ''.join(buf)
+            buf,n = [],0
+    if buf: yield ''.join(buf)
+
+async def _xt_stream(req, resp, chunk_size=16384):
+    "Like `_xt_cts`, but renders incrementally, sending a full page's `<head>` straight away"
+    resp,indent = tuplify(resp),fh_cfg.indent
+    if not is_full_page(req, resp):
+        heads,bdy = _page_parts(req, resp)
+        cs,shell = _shell_body(req, bdy)
+        if shell:
+            pre,mid,suf = shell
+            yield pre + _to_xml(req, tuple(heads), indent, lvl=4) + mid
+            async for s in _buffered(_ft_chunks(req, cs, 4, indent), chunk_size): yield s
+            yield suf
+            return
+        resp = _respond_wrapped(req, heads, cs)
+    async for s in _buffered(_ft_chunks(req, resp, 0, indent), chunk_size): yield s
+
 # %% ../nbs/api/00_core.ipynb #775fb66b
 def _is_ft_resp(resp):
     "Check if response is a FastTag-compatible type"
@@ -515,7 +1016,7 @@ def _resp(req, resp, cls=empty, status_code=200):
     if resp is None: resp=''
     if hasattr(resp, '__response__'): resp = resp.__response__(req)
     if not (isinstance(cls, type) and issubclass(cls, Response)): cls=empty
-    if isinstance(resp, FileResponse) and not os.path.exists(resp.path): raise HTTPException(404, resp.path)
+    if isinstance(resp, FileResponse) and resp.stat_result is None and not os.path.exists(resp.path): raise HTTPException(404, resp.path)
     resp,kw = _part_resp(req, resp)
     if isinstance(resp, Response): return resp
     if cls is not empty: return cls(resp, status_code=status_code, **kw)
@@ -590,9 +1091,9 @@ def _list(o):
 def _wrap_ex(f, status_code, hdrs, ftrs, htmlkw, bodykw, body_wrap):
     "Wrap exception handler with FastHTML request processing"
     async def _f(req, exc):
-        req.hdrs,req.ftrs,req.htmlkw,req.bodykw = map(deepcopy, (hdrs, ftrs, htmlkw, bodykw))
+        req._page_defaults = hdrs,ftrs,htmlkw,bodykw
         req.body_wrap = body_wrap
-        res = await _handle(f, req, exc)
+        res = await _resolve(await _handle(f, req, exc))
         return _resp(req, res, status_code=status_code)
     return _f
 
@@ -677,6 +1178,103 @@ class Lifespan:
     def on_event(self, event_type):
         return lambda f: (getattr(self, event_type)).append(f)
 
+# %% ../nbs/api/00_core.ipynb #dce68049
+def _scope_host(scope):
+    "Host name the request was sent to, without any port, parsed from the headers once and kept in `scope`"
+    if (host := scope.get('fh_host')) is None:
+        host = scope['fh_host'] = next((v.decode('latin-1') for k,v in scope.get('headers', ()) if k==b'host'), '').split(':')[0]
+    return host
+
+class HostRoute(Route):
+    "Route with optional host-header constraint using Starlette's {param} pattern syntax"
+    def __init__(self, path, endpoint, *, host=None, **kwargs):
+        super().__init__(path, endpoint, **kwargs)
+        self.host = host
+        if host: self.host_regex, self.host_format, self.host_convertors = compile_path(host)
+
+    def matches(self, scope):
+        if self.host and not self.host_regex.match(_scope_host(scope)): return Match.NONE, {}
+        return super().matches(scope)
+
+    def __repr__(self) -> str:
+        methods = sorted(self.methods or [])
+        return f"{self.__class__.__name__}(path={self.path!r}, name={self.name!r}, methods={methods!r}, host={self.host!r})"
+
+# %% ../nbs/api/00_core.ipynb #189d2f4b
+from starlette.routing import get_route_path
+from starlette.datastructures import URL
+
+def _path_index(routes, idxs):
+    "Map literal paths to the positions of their routes, and literal path prefixes to those of parameterised routes and mounts"
+    static,tree = {},{}
+    for i in idxs:
+        r = routes[i]
+        path,node = getattr(r, 'path', None),tree
+        if isinstance(r, (Route,WebSocketRoute)) and isinstance(path, str) and '{' not in path:
+            static.setdefault(path, []).append(i)
+            continue
+        if isinstance(r, (Route,WebSocketRoute,Mount)) and isinstance(path, str):
+            for seg in path.split('/'):
+                if '{' in seg: break
+                node = node.setdefault(seg, {})
+        node.setdefault(None, []).append(i)
+    return static,tree
+
+def _index_lookup(index, path):
+    "Positions of the routes in path `index` that could match `path`"
+    static,node = index
+    pos = static.get(path, []) + node.get(None, [])
+    for seg in path.split('/'):
+        if (node := node.get(seg)) is None: break
+        pos += node.get(None, ())
+    return pos
+
+class IndexedRouter(Router):
+    "Starlette `Router` which only tries routes that could match the request host and path, found with an index"
+    _index = None
+
+    def _build_index(self):
+        "Path indexes of the routes for each literal host, and of all other routes"
+        hosts,rest = {},[]
+        for i,r in enumerate(self.routes):
+            host = getattr(r, 'host', None) if isinstance(r, HostRoute) else None
+            if host and '{' not in host: hosts.setdefault(host, []).append(i)
+            else: rest.append(i)
+        return _path_index(self.routes, rest),{h:_path_index(self.routes, o) for h,o in hosts.items()}
+
+    def candidates(self, path, host=None):
+        "Routes that could match `path` on `host`, in route order"
+        routes,idx = self.routes,self._index
+        if idx is None or idx[0] is not routes or idx[1]!=len(routes): idx = self._index = routes,len(routes),*self._build_index()
+        pos = _index_lookup(idx[2], path)
+        if (hidx := idx[3].get(host)) is not None: pos += _index_lookup(hidx, path)
+        return [routes[i] for i in sorted(pos)]
+
+    async def app(self, scope, receive, send):
+        assert scope["type"] in ("http", "websocket", "lifespan")
+        if "router" not in scope: scope["router"] = self
+        if scope["type"] == "lifespan": return await self.lifespan(scope, receive, send)
+        partial,route_path,host = None,get_route_path(scope),_scope_host(scope)
+        for route in self.candidates(route_path, host):
+            match,child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope["route"] = route
+                scope.update(child_scope)
+                return await route.handle(scope, receive, send)
+            elif match == Match.PARTIAL and partial is None: partial,partial_scope = route,child_scope
+        if partial is not None:
+            scope["route"] = partial
+            scope.update(partial_scope)
+            return await partial.handle(scope, receive, send)
+        if scope["type"] == "http" and self.redirect_slashes and route_path != "/":
+            redirect_scope = dict(scope)
+            if route_path.endswith("/"): redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else: redirect_scope["path"] = redirect_scope["path"] + "/"
+            for route in self.candidates(get_route_path(redirect_scope), host):
+                if route.matches(redirect_scope)[0] != Match.NONE:
+                    return await RedirectResponse(url=str(URL(scope=redirect_scope)))(scope, receive, send)
+        await self.default(scope, receive, send)
+
 # %% ../nbs/api/00_core.ipynb #3327a1e9
 class FastHTML(Starlette):
     "An HTML-first Starlette app: handler params filled from the request, FT returns rendered as pages or HTMX fragments"
@@ -685,7 +1283,7 @@ class FastHTML(Starlette):
                  before=None, after=None, surreal=True, htmx=True, htmx4=False, default_hdrs=True, sess_cls=SessionMiddleware,
                  secret_key=None, session_cookie='session_', max_age=365*24*3600, sess_path='/',
                  same_site='lax', sess_https_only=False, sess_domain=None, key_fname='.sesskey',
-                 body_wrap=noop_body, htmlkw=None, nb_hdrs=False, canonical=True, max_part_size=DEF_MAXPART, **bodykw):
+                 body_wrap=noop_body, htmlkw=None, nb_hdrs=False, canonical=True, max_part_size=DEF_MAXPART, compress=False, **bodykw):
         middleware,before,after = map(_list, (middleware,before,after))
         self.title,self.canonical,self.session_cookie,self.key_fname = title,canonical,session_cookie,key_fname
         hdrs,ftrs,exts = map(listify, (hdrs,ftrs,exts))
@@ -700,6 +1298,7 @@ class FastHTML(Starlette):
             from IPython.display import display,HTML
             if nb_hdrs: display(HTML(to_xml(tuple(hdrs))))
             middleware.append(cors_allow)
+        if compress: middleware.insert(0, Middleware(CompressMiddleware, **(compress if isinstance(compress, dict) else {})))
         self.lifespan = Lifespan(on_startup, on_shutdown, lifespan)
         self.hdrs,self.ftrs = hdrs,ftrs
         self.body_wrap,self.before,self.after,self.htmlkw,self.bodykw,self.max_part_size = body_wrap,before,after,htmlkw,bodykw,max_part_size
@@ -715,77 +1314,138 @@ class FastHTML(Starlette):
             exception_handlers[404] = _not_found
         excs = {k:_wrap_ex(v, k, hdrs, ftrs, htmlkw, bodykw, body_wrap=body_wrap) for k,v in exception_handlers.items()}
         super().__init__(debug, routes, middleware=middleware, exception_handlers=excs, lifespan=self.lifespan)
+        self.router = IndexedRouter(routes, lifespan=self.lifespan)
 
     def on_event(self, event_type): return self.lifespan.on_event(event_type)
 
-# %% ../nbs/api/00_core.ipynb #dce68049
-class HostRoute(Route):
-    "Route with optional host-header constraint using Starlette's {param} pattern syntax"
-    def __init__(self, path, endpoint, *, host=None, **kwargs):
-        super().__init__(path, endpoint, **kwargs)
-        self.host = host
-        if host: self.host_regex, self.host_format, self.host_convertors = compile_path(host)
-
-    def matches(self, scope):
-        if self.host:
-            host = Headers(scope=scope).get("host", "").split(":")[0]
-            if not self.host_regex.match(host): return Match.NONE, {}
-        return super().matches(scope)
+# %% ../nbs/api/00_core.ipynb #1fe762ef
+_hx_vary = "HX-Request, HX-History-Restore-Request"
+
+def _etag(b): return f'W/"{hashlib.blake2b(b, digest_size=8).hexdigest()}"'
+
+def _etag_match(inm, etag):
+    "Whether `If-None-Match` header value `inm` matches `etag`, by weak comparison"
+    return bool(inm) and (inm.strip()=='*' or etag.removeprefix('W/') in {o.strip().removeprefix('W/') for o in inm.split(',')})
+
+class HttpCache:
+    "A route's HTTP caching policy: `Cache-Control` headers, and weak `ETag`s from the body or `key`'s result, answering a matching `If-None-Match` with 304"
+    def __init__(self, max_age=0, public=False, key=None):
+        self.key,self.plan = key,(_ps_plan(_params(key)) if key else None)
+        self.cc = f"{'public' if public else 'private'}, " + (f'max-age={max_age}' if max_age else 'no-cache')
+
+    def not_modified(self, etag, vary=_hx_vary):
+        return Response(status_code=304, headers={'etag': etag, 'cache-control': self.cc, 'vary': vary})
+
+    async def check(self, req):
+        "ETag from `key` for `req`, and a 304 response instead of running the handler if the client has it"
+        if not self.key or req.method not in ('GET','HEAD'): return None,None
+        v = await _wrap_call(self.key, req, self.plan)
+        etag = _etag(f"{v}|{req.headers.get('hx-request','')}|{req.headers.get('hx-history-restore-request','')}".encode())
+        return etag,(self.not_modified(etag) if _etag_match(req.headers.get('if-none-match'), etag) else None)
+
+    def respond(self, req, resp, etag=None):
+        "Add caching headers to `resp`, or replace it with a 304 if `req` already has it"
+        if req.method not in ('GET','HEAD') or resp.status_code!=200: return resp
+        body = getattr(resp, 'body', None)
+        if not (etag := etag or resp.headers.get('etag') or (isinstance(body, bytes) and _etag(body))): return resp
+        if _etag_match(req.headers.get('if-none-match'), etag): return self.not_modified(etag, resp.headers.get('vary', _hx_vary))
+        resp.headers['etag'] = etag
+        resp.headers.setdefault('cache-control', self.cc)
+        return resp
 
-    def __repr__(self) -> str:
-        methods = sorted(self.methods or [])
-        return f"{self.__class__.__name__}(path={self.path!r}, name={self.name!r}, methods={methods!r}, host={self.host!r})"
+    async def fetch(self, req, etag, render):
+        "Response to `req` from `render`, with caching headers"
+        return self.respond(req, await render(), etag)
 
 # %% ../nbs/api/00_core.ipynb #e0accf76
+def _route_key(r): return r.path,r.name,frozenset(r.methods or ())  # an `HTTPEndpoint` route's `methods` is `None`
+
 @patch
 def add_route(self:FastHTML, route):
     "Add or replace a route in the FastHTML app"
     route.methods = [m.upper() for m in listify(route.methods)]
-    self.router.routes = [r for r in self.router.routes if not
-                   (r.path==route.path and r.name == route.name and
-                    ((route.methods is None) or (set(r.methods) == set(route.methods))))]
-    self.router.routes.append(route)
-    self.router.routes.sort(key=lambda r: not getattr(r, 'host', None))
-
+    rtr,key = self.router,_route_key(route)
+    routes,idx = rtr.routes,getattr(rtr, '_route_keys', None)
+    if idx is None or idx[0] is not routes or idx[1]!=len(routes):
+        # The routes have been changed other than by `add_route`, so filter and sort them in full, and index them again
+        rtr.routes = routes = [r for r in routes if not (r.path==route.path and r.name==route.name and set(r.methods or ())==set(route.methods))]
+        routes.sort(key=lambda r: not getattr(r, 'host', None))
+        keys,nhost = {_route_key(r):r for r in routes if hasattr(r, 'methods')},sum(bool(getattr(r, 'host', None)) for r in routes)
+    else:
+        keys,nhost = idx[2:]
+        if old := keys.pop(key, None):
+            routes.remove(old)
+            nhost -= bool(getattr(old, 'host', None))
+    # Host routes go before the others, as in a stable sort by `not host`
+    if getattr(route, 'host', None):
+        routes.insert(nhost, route)
+        nhost += 1
+    else: routes.append(route)
+    keys[key] = route
+    rtr._route_keys,rtr._index = (routes,len(routes),keys,nhost),None
 
 # %% ../nbs/api/00_core.ipynb #246bd8d1
 all_meths = 'get post put delete patch head trace options'.split()
 
 # %% ../nbs/api/00_core.ipynb #26b147ba
+def _hook(b):
+    "Compile a `before`/`after` function or `Beforeware` into an `(f, plan, beforeware)` triple"
+    if isinstance(b, Beforeware): return b.f,_ps_plan(_params(b.f)),b
+    return b,_ps_plan(_params(b)),None
+
 @patch
-def _endp(self:FastHTML, f, body_wrap, before:Optional[Callable|tuple]=None):
+def _hooks(self:FastHTML):
+    "App `before` and `after` hooks compiled by `_hook`, recompiled only when those lists change"
+    key = tuple(self.before),tuple(self.after)
+    if getattr(self, '_hooks_key', None) != key: self._hooks_key,self._hooks_c = key,tuple(tuple(map(_hook, o)) for o in key)
+    return self._hooks_c
+
+async def _run_before(hooks, req):
+    "Call each compiled `before` hook not skipped for this path, stopping at the first truthy response"
+    path = req.url.path
+    for bf,plan,bw in hooks:
+        # `skip_re` is read on each request, so changes to `skip` take effect straight away
+        if bw and (skip := bw.skip_re) and skip.fullmatch(path): continue
+        if (resp := await _wrap_call(bf, req, plan)): return resp
+
+@patch
+def _endp(self:FastHTML, f, body_wrap, before:Optional[Callable|tuple]=None, cache:HttpCache|None=None):
     "Create endpoint wrapper with before/after middleware processing"
     sig = signature_ex(f, True)
     for n,p in sig.parameters.items(): (msg:=_check_anno(n,p.annotation)) and warn(msg)
+    plan,befores = _ps_plan(sig.parameters),tuple(map(_hook, listify(before)))
     async def _f(req):
         resp = None
         req.injects = []
         req.max_part_size = self.max_part_size
-        req.hdrs,req.ftrs,req.htmlkw,req.bodykw = map(deepcopy, (self.hdrs,self.ftrs,self.htmlkw,self.bodykw))
-        req.hdrs,req.ftrs = listify(req.hdrs),listify(req.ftrs)
-        for b in self.before:
-            if not resp:
-                if isinstance(b, Beforeware): bf,skip = b.f,b.skip
-                else: bf,skip = b,[]
-                if not any(re.fullmatch(r, req.url.path) for r in skip):
-                    resp = await _wrap_call(bf, req, _params(bf))
-        for b in listify(before):
-            if not resp: resp = await _wrap_call(b, req, _params(b))
+        req._page_defaults = self.hdrs,self.ftrs,self.htmlkw,self.bodykw
+        app_befores,afters = self._hooks()
+        resp = await _run_before(app_befores, req) or await _run_before(befores, req)
         req.body_wrap = body_wrap
-        if not resp: resp = await _wrap_call(f, req, sig.parameters)
-        for a in self.after:
-            wreq = await _wrap_req(req, _params(a))
+        if resp or not cache: return await _render(req, resp, afters)
+        etag,nm = await cache.check(req)
+        return nm or await cache.fetch(req, etag, partial(_render, req, None, afters))
+
+    async def _render(req, resp, afters):
+        "Call `f` unless a `before` hook returned `resp`, then the `after` hooks, and build the response"
+        if not resp: resp = await _wrap_call(f, req, plan)
+        resp = await _resolve(resp, deep=_to_attr is None)  # without fastcore's internals, `_ft_xml` can't defer lazy children
+        for a,aplan,_ in afters:
+            wreq = await _wrap_req(req, aplan)
             wreq['resp'] = resp
             nr = a(**wreq)
             if nr: resp = nr
-        return _resp(req, resp, sig.return_annotation)
+        req._fh_lazy = _Deferred()  # components with lazy children that `_ft_xml` defers
+        try: r = _resp(req, resp, sig.return_annotation)
+        finally: lazy = req.__dict__.pop('_fh_lazy')
+        return await _fill_lazy(req, r, lazy) if lazy else r
     return _f
 
 # %% ../nbs/api/00_core.ipynb #3818575c
 @patch
-def _add_ws(self:FastHTML, func, path, conn, disconn, name, middleware):
+def _add_ws(self:FastHTML, func, path, conn, disconn, name, middleware, coalesce=None):
     "Add websocket route to FastHTML app"
-    endp = _ws_endp(func, conn, disconn)
+    endp = _ws_endp(func, conn, disconn, coalesce)
     route = WebSocketRoute(path, endpoint=endp, name=name, middleware=middleware)
     route.methods = ['ws']
     self.add_route(route)
@@ -793,16 +1453,16 @@ def _add_ws(self:FastHTML, func, path, conn, disconn, name, middleware):
 
 # %% ../nbs/api/00_core.ipynb #669e76eb
 @patch
-def ws(self:FastHTML, path:str, conn=None, disconn=None, name=None, middleware=None):
-    "Add a websocket route at `path`"
-    def f(func=noop): return self._add_ws(func, path, conn, disconn, name=name, middleware=middleware)
+def ws(self:FastHTML, path:str, conn=None, disconn=None, name=None, middleware=None, coalesce:float|None=None):
+    "Add a websocket route at `path`, optionally coalescing sends made within `coalesce` seconds into one frame"
+    def f(func=noop): return self._add_ws(func, path, conn, disconn, name=name, middleware=middleware, coalesce=coalesce)
     return f
 
 # %% ../nbs/api/00_core.ipynb #j6ete5u68fo
 @patch
-def add_websocket_route(self:FastHTML, path, func, conn=None, disconn=None, name=None, middleware=None):
+def add_websocket_route(self:FastHTML, path, func, conn=None, disconn=None, name=None, middleware=None, coalesce=None):
     "Add a websocket route at `path` (Starlette-compatible API)"
-    return self._add_ws(func, path, conn, disconn, name=name, middleware=middleware)
+    return self._add_ws(func, path, conn, disconn, name=name, middleware=middleware, coalesce=coalesce)
 
 # %% ../nbs/api/00_core.ipynb #919618c3
 def _mk_locfunc(f, p, app=None):
@@ -825,14 +1485,14 @@ def nested_name(f):
 
 # %% ../nbs/api/00_core.ipynb #daafe4fc
 @patch
-def _add_routes(self:FastHTML, cls, path, methods, name, include_in_schema, body_wrap, host=None, before:Optional[Callable|tuple]=None):
+def _add_routes(self:FastHTML, cls, path, methods, name, include_in_schema, body_wrap, host=None, before:Optional[Callable|tuple]=None, cache=None):
     "Add HTTP routes from methods on endpoint class `cls`"
     assert not methods, '`methods` is not supported for class route groups; define HTTP methods as class methods instead'
     lf = _mk_locfunc(cls, path, app=self)
     lf.__routename__ = name
     for meth in all_meths:
         handler = getattr(cls, meth, None)
-        if handler: self._add_route(handler, path, meth, name, include_in_schema, body_wrap, host=host, before=before)
+        if handler: self._add_route(handler, path, meth, name, include_in_schema, body_wrap, host=host, before=before, cache=cache)
     return lf
 
 # %% ../nbs/api/00_core.ipynb #3710e48b
@@ -846,14 +1506,14 @@ def _route_pn(func, path, name):
     return name,fn,p
 
 @patch
-def _add_route(self:FastHTML, func, path, methods, name, include_in_schema, body_wrap, host=None, before:Optional[Callable|tuple]=None):
+def _add_route(self:FastHTML, func, path, methods, name, include_in_schema, body_wrap, host=None, before:Optional[Callable|tuple]=None, cache=None):
     "Add HTTP route to FastHTML app with automatic method detection"
     n,fn,p = _route_pn(func, path, name)
-    if isinstance(func, type): return self._add_routes(func, p, methods, n, include_in_schema, body_wrap, host=host, before=before)
+    if isinstance(func, type): return self._add_routes(func, p, methods, n, include_in_schema, body_wrap, host=host, before=before, cache=cache)
     if methods: m = [methods] if isinstance(methods,str) else methods
     elif fn in all_meths and p is not None: m = [fn]
     else: m = ['get','post']
-    endp = self._endp(func, body_wrap or self.body_wrap, before=before)
+    endp = self._endp(func, body_wrap or self.body_wrap, before=before, cache=cache)
     route = HostRoute(p, endpoint=endp, methods=m, name=n, include_in_schema=include_in_schema, host=host)
     self.add_route(route)
     lf = _mk_locfunc(func, p, app=self)
@@ -862,14 +1522,101 @@ def _add_route(self:FastHTML, func, path, methods, name, include_in_schema, body
 
 # %% ../nbs/api/00_core.ipynb #f5cb2c2b
 @patch
-def route(self:FastHTML, path:str=None, methods=None, name=None, include_in_schema=True, body_wrap=None, host=None, before:Optional[Callable|tuple]=None):
-    "Add a route at `path`"
+def route(self:FastHTML, path:str=None, methods=None, name=None, include_in_schema=True, body_wrap=None, host=None, before:Optional[Callable|tuple]=None,
+          cache:HttpCache|None=None):
+    "Add a route at `path`, with HTTP caching policy `cache`"
     def f(func):
-        return self._add_route(func, path, methods, name=name, include_in_schema=include_in_schema, body_wrap=body_wrap, host=host, before=before)
+        return self._add_route(func, path, methods, name=name, include_in_schema=include_in_schema, body_wrap=body_wrap, host=host, before=before, cache=cache)
     return f(path) if callable(path) else f
 
 for o in all_meths: setattr(FastHTML, o, partialmethod(FastHTML.route, methods=o))
 
+# %% ../nbs/api/00_core.ipynb #db062ab9
+import time
+from collections import OrderedDict
+
+class _Cached:
+    "A stored response: its status, headers and body, when it was stored, and its tags"
+    def __init__(self, resp, tags):
+        self.status,self.body,self.t,self.tags = resp.status_code,resp.body,time.monotonic(),tags
+        self.raw = [(k,v) for k,v in resp.raw_headers if k!=b'etag'] + [(b'etag', _etag(resp.body).encode())]
+        self.size = len(self.body) + sum(len(k)+len(v) for k,v in self.raw)
+
+    def response(self):
+        resp = Response(self.body, self.status)
+        resp.raw_headers = list(self.raw)
+        return resp
+
+class ResponseCache(HttpCache):
+    "`HttpCache` that also keeps rendered responses for `ttl` seconds, keyed by host, path, query `params`, `session` keys and HTMX headers"
+    def __init__(self, ttl=60, stale=0, max_bytes=64*2**20, params=None, session=(), tags=(), max_age=0, public=False, key=None):
+        super().__init__(max_age=max_age, public=public, key=key)
+        self.ttl,self.stale,self.max_bytes,self.params,self.session,self.tags = ttl,stale,max_bytes,params,session,set(tags)
+        self.entries,self.pending,self.size,self.gen = OrderedDict(),{},0,0
+
+    def _key(self, req):
+        q,sess = req.query_params,req.scope.get('session', {})
+        qs = tuple(sorted(q.multi_items())) if self.params is None else tuple((n,tuple(q.getlist(n))) for n in self.params)
+        return (req.headers.get('host'), req.url.path, qs, tuple(repr(sess.get(n)) for n in self.session),
+                req.headers.get('hx-request'), req.headers.get('hx-history-restore-request'))
+
+    def _drop(self, k): self.size -= self.entries.pop(k).size
+
+    def _store(self, k, req, resp):
+        "Keep `resp` as the response for `k`, unless it's specific to this request or not a complete 200"
+        if (resp.status_code!=200 or not isinstance(getattr(resp, 'body', None), bytes) or req.injects
+            or 'set-cookie' in resp.headers or 'no-store' in resp.headers.get('cache-control', '')): return
+        e = _Cached(resp, self.tags | req.cache_tags)
+        if e.size > self.max_bytes: return
+        if k in self.entries: self._drop(k)
+        self.entries[k] = e
+        self.size += e.size
+        while self.size > self.max_bytes: self._drop(next(iter(self.entries)))
+        return e
+
+    async def _load(self, k, req, render):
+        "Render and store the response for `k`, with concurrent requests for `k` waiting for this one instead of rendering too"
+        if (fut := self.pending.get(k)) is not None:
+            e = await asyncio.shield(fut)
+            return e.response() if e else await render()
+        fut = self.pending[k] = asyncio.get_running_loop().create_future()
+        gen,e = self.gen,None
+        req.cache_tags = set()
+        try:
+            resp = await render()
+            if gen==self.gen: e = self._store(k, req, resp)
+            return resp
+        finally:
+            del self.pending[k]
+            fut.set_result(e)
+
+    async def _refresh(self, k, req, render):
+        if k in self.pending: return
+        req.injects = []
+        try: await self._load(k, req, render)
+        except Exception as ex: warn(f'Refreshing cached response for {req.url.path} failed: {ex!r}')
+
+    async def fetch(self, req, etag, render):
+        "Response to `req` from the cache, from `render` if it's missing or expired, or stale while `render` refreshes it in the background"
+        if req.method not in ('GET','HEAD'): return await super().fetch(req, etag, render)
+        k = self._key(req)
+        age,refresh = time.monotonic()-e.t if (e := self.entries.get(k)) else None,None
+        if age is None or age > self.ttl+self.stale: resp = await self._load(k, req, render)
+        else:
+            self.entries.move_to_end(k)
+            resp = e.response()
+            if age > self.ttl: refresh = BackgroundTask(self._refresh, k, req, render)
+        resp = self.respond(req, resp, etag)
+        # Attached to what `respond` returns, so a 304 for a stale entry still refreshes it
+        if refresh: resp.background = refresh
+        return resp
+
+    def invalidate(self, *tags):
+        "Drop stored responses with any of `tags`, or all of them if none are given"
+        tags = set(tags)
+        for k in [k for k,e in self.entries.items() if not tags or e.tags & tags]: self._drop(k)
+        self.gen += 1
+
 # %% ../nbs/api/00_core.ipynb #35c35a96
 @patch
 def set_lifespan(self:FastHTML, value):
@@ -968,13 +1715,13 @@ class APIRouter:
         if name not in all_meths: setattr(self.rt_funcs, name, wrapped)
         return wrapped
 
-    def __call__(self, path:str=None, methods=None, name=None, include_in_schema=True, body_wrap=None):
+    def __call__(self, path:str=None, methods=None, name=None, include_in_schema=True, body_wrap=None, cache=None):
         "Add a route at `path`"
         def f(func):
             n,_,p = _route_pn(func, path, name)
             p = self.prefix + p
             wrapped = self._wrap_func(func, p, n)
-            self.routes.append((func, p, methods, n, include_in_schema, body_wrap or self.body_wrap))
+            self.routes.append((func, p, methods, n, include_in_schema, body_wrap or self.body_wrap, cache))
             return wrapped
         return f(path) if callable(path) else f
 
@@ -984,12 +1731,12 @@ class APIRouter:
 
     def to_app(self, app):
         "Add routes to `app`"
-        for args in self.routes: app._add_route(*args)
+        for *args,cache in self.routes: app._add_route(*args, cache=cache)
         for args in self.wss: app._add_ws(*args)
 
-    def ws(self, path:str, conn=None, disconn=None, name=None, middleware=None):
+    def ws(self, path:str, conn=None, disconn=None, name=None, middleware=None, coalesce:float|None=None):
         "Add a websocket route at `path`"
-        def f(func=noop): return self.wss.append((func, f"{self.prefix}{path}", conn, disconn, name, middleware))
+        def f(func=noop): return self.wss.append((func, f"{self.prefix}{path}", conn, disconn, name, middleware, coalesce))
         return f
 
 # %% ../nbs/api/00_core.ipynb #259a0f53
@@ -1019,6 +1766,98 @@ def reg_re_param(m, s):
     cls = get_class(f'{m}Conv', sup=StringConvertor, regex=s)
     register_url_convertor(m, cls())
 
+# %% ../nbs/api/00_core.ipynb #40f1ca69
+from email.utils import formatdate
+from mimetypes import guess_type
+from stat import S_ISREG
+import threading
+
+# %% ../nbs/api/00_core.ipynb #3e5e438e
+def _accept_encs(hdr):
+    "Encodings in `Accept-Encoding` header value `hdr`, other than those with `q=0`"
+    res = set()
+    for o in hdr.split(','):
+        enc,_,q = (s.strip() for s in o.partition(';'))
+        try: ok = not q.startswith('q=') or float(q[2:])>0
+        except ValueError: ok = False
+        if enc and ok: res.add(enc.lower())
+    return res
+
+def _nbytes(f): return sum(len(o[2]) for o in f[2].values() if o[2] is not None)
+
+# %% ../nbs/api/00_core.ipynb #f6116fd6
+class StaticCache:
+    "Serve files under `root`, keeping those of up to `max_file` bytes in an LRU cache of `max_bytes`, and preferring precompressed `.br`/`.gz` siblings"
+    encodings = {'br':'.br', 'gzip':'.gz'}
+    def __init__(self, root='.', max_bytes=32*2**20, max_file=256*2**10, headers=None, reload=True):
+        self.root,self.max_bytes,self.max_file,self.reload = str(root),max_bytes,min(max_file, max_bytes),reload
+        self.headers,self.files,self.size,self.lock = headers or {},OrderedDict(),0,threading.Lock()
+
+    def _variant(self, p, st, ts, enc, vary):
+        body = Path(p).read_bytes() if st.st_size <= self.max_file else None
+        suf = '' if enc=='identity' else f'-{enc}'
+        hdrs = {'etag': f'"{ts.st_mtime_ns:x}-{st.st_size:x}{suf}"', 'last-modified': formatdate(ts.st_mtime, usegmt=True),
+                'content-length': str(st.st_size), **self.headers}
+        if vary: hdrs['vary'] = 'Accept-Encoding'
+        if suf: hdrs['content-encoding'] = enc
+        return p,st,body,hdrs
+
+    def _load(self, p, st):
+        "Stat results, cached bytes, and headers of `p` and its precompressed siblings"
+        sibs = {}
+        for enc,ext in self.encodings.items():
+            try: sibs[enc] = p+ext,os.stat(p+ext)
+            except OSError: pass
+        vs = {enc:self._variant(sp, sst, st, enc, True) for enc,(sp,sst) in sibs.items()}
+        vs['identity'] = self._variant(p, st, st, 'identity', bool(sibs))
+        return st,guess_type(p)[0] or 'application/octet-stream',vs
+
+    def _cached(self, fname):
+        "Cached entry for `fname`, marked as recently used, without checking the file"
+        with self.lock:
+            if (f := self.files.get(fname)) is not None: self.files.move_to_end(fname)
+        return f
+
+    def _store(self, fname, f):
+        "Replace the cached entry for `fname` with `f` (or drop it if `None`), evicting the least recently used to fit"
+        with self.lock:
+            if (old := self.files.pop(fname, None)) is not None: self.size -= _nbytes(old)
+            if f is None: return
+            self.files[fname] = f
+            self.size += _nbytes(f)
+            while self.size > self.max_bytes and self.files: self.size -= _nbytes(self.files.popitem(last=False)[1])
+
+    def get(self, fname):
+        "Cached entry for `fname`, reloading it if `reload` and the file has changed, or `None` if there's no such file; this blocks on the filesystem"
+        f = self._cached(fname)
+        if f is not None and not self.reload: return f
+        rel = os.path.normpath(fname)
+        if os.path.isabs(rel) or rel.split(os.sep)[0]=='..': return
+        p = os.path.join(self.root, rel)
+        try: st = os.stat(p)
+        except OSError: st = None
+        if f is not None and st and (st.st_mtime_ns,st.st_size)==(f[0].st_mtime_ns,f[0].st_size): return f
+        f = self._load(p, st) if st is not None and S_ISREG(st.st_mode) else None
+        self._store(fname, f)
+        return f
+
+    async def response(self, req, fname):
+        "Response for `req` for file `fname`: 304 if the client's copy is current, else the best encoding it accepts"
+        # Filesystem access happens in a worker thread; with `reload=False`, a cached file needs none
+        f = None if self.reload else self._cached(fname)
+        if f is None and (f := await run_in_threadpool(self.get, fname)) is None: raise HTTPException(404, fname)
+        _,media_type,vs = f
+        enc = 'identity'
+        if 'range' not in req.headers:
+            accepts = _accept_encs(req.headers.get('accept-encoding', ''))
+            enc = next((e for e in self.encodings if e in vs and (e in accepts or '*' in accepts)), enc)
+        p,st,body,hdrs = vs[enc]
+        if _etag_match(req.headers.get('if-none-match'), hdrs['etag']):
+            return Response(status_code=304, headers={k:v for k,v in hdrs.items() if k!='content-length'})
+        if body is None or enc=='identity' and 'range' in req.headers:
+            return FileResponse(p, headers=hdrs, media_type=media_type, stat_result=st)
+        return Response(body, headers=hdrs, media_type=media_type)
+
 # %% ../nbs/api/00_core.ipynb #e9535978
 # Starlette doesn't have the '?', so it chomps the whole remaining URL
 reg_re_param("path", ".*?")
@@ -1026,17 +1865,19 @@ _static_exts = "ico gif jpg jpeg webm css js woff png svg mp4 webp ttf otf eot w
 reg_re_param("static", '|'.join(_static_exts))
 
 @patch
-def static_route_exts(self:FastHTML, prefix='/', static_path='.', exts='static'):
-    "Add a static route at URL path `prefix` with files from `static_path` and `exts` defined by `reg_re_param()`"
+def static_route_exts(self:FastHTML, prefix='/', static_path='.', exts='static', cache:StaticCache|None=None):
+    "Add a static route at URL path `prefix` with files from `static_path` and `exts` defined by `reg_re_param()`, served by `cache`"
+    cache = cache or StaticCache(static_path)
     @self.get(f"{prefix}{{fname:path}}.{{ext:{exts}}}")
-    async def get(fname:str, ext:str): return FileResponse(f'{static_path}/{fname}.{ext}')
+    async def get(req, fname:str, ext:str): return await cache.response(req, f'{fname}.{ext}')
 
 # %% ../nbs/api/00_core.ipynb #b31de65a
 @patch
-def static_route(self:FastHTML, ext='', prefix='/', static_path='.'):
-    "Add a static route at URL path `prefix` with files from `static_path` and single `ext` (including the '.')"
+def static_route(self:FastHTML, ext='', prefix='/', static_path='.', cache:StaticCache|None=None):
+    "Add a static route at URL path `prefix` with files from `static_path` and single `ext` (including the '.'), served by `cache`"
+    cache = cache or StaticCache(static_path)
     @self.get(f"{prefix}{{fname:path}}{ext}")
-    async def get(fname:str): return FileResponse(f'{static_path}/{fname}{ext}')
+    async def get(req, fname:str): return await cache.response(req, f'{fname}{ext}')
 
 # %% ../nbs/api/00_core.ipynb #f63b7a03
 class StaticNoCache(StaticFiles):
@@ -1055,16 +1896,119 @@ class StaticImmutable(StaticFiles):
         return resp
 
 # %% ../nbs/api/00_core.ipynb #e38fd6c7
+def _fhash(p): return hashlib.blake2b(p.read_bytes(), digest_size=4).hexdigest()
+
 @flexicache(mtime_policy(arg=0))
-def _vhash(p): return hashlib.blake2b(p.read_bytes(), digest_size=4).hexdigest()
+def _vhash(p): return _fhash(p)
+
+_vmanifest = {}
 
 def vurl(path, root='.'):
     "Return `path` as a URL with a `v` query param hashing the file's contents, so the URL changes when the file does"
     u = urlsplit(str(path))
-    p = Path(root)/u.path.lstrip('/')
+    k = u.path.lstrip('/')
+    v = _vmanifest.get(k) or _vhash(Path(root)/k)
     q = f'{u.query}&' if u.query else ''
-    return urlunsplit(u._replace(query=f'{q}v={_vhash(p)}'))
-
+    return urlunsplit(u._replace(query=f'{q}v={v}'))
+
+
+# %% ../nbs/api/00_core.ipynb #c5f211fa
+def asset_manifest(root='.', exts=_static_exts, dest=None):
+    "Hash the contents of each non-hidden file under `root` with one of `exts`, saving the manifest as JSON to `dest` if given"
+    root = Path(root)
+    res = {}
+    for p in sorted(root.rglob('*')):
+        rel = p.relative_to(root)
+        if p.suffix[1:] in exts and p.is_file() and not any(o.startswith('.') for o in rel.parts): res[rel.as_posix()] = _fhash(p)
+    if dest: Path(dest).write_text(json.dumps(res, indent=1))
+    return res
+
+def set_vurl_manifest(m=None):
+    "Have `vurl` take hashes from manifest `m`, a dict or path saved by `asset_manifest`, instead of the files; `None` to stop"
+    _vmanifest.clear()
+    if m is not None: _vmanifest.update(m if isinstance(m, dict) else json.loads(Path(m).read_text()))
+
+# %% ../nbs/api/00_core.ipynb #93106f42
+import zlib
+from starlette.datastructures import MutableHeaders
+
+def _gzip_enc(level=None):
+    c = zlib.compressobj(5 if level is None else level, zlib.DEFLATED, 31)
+    return (lambda b: c.compress(b)+c.flush(zlib.Z_SYNC_FLUSH)),(lambda b=b'': c.compress(b)+c.flush())
+
+def _br_enc(level=None):
+    import brotli
+    c = brotli.Compressor(quality=4 if level is None else level)
+    return (lambda b: c.process(b)+c.flush()),(lambda b=b'': c.process(b)+c.finish())
+
+def _zstd_enc(level=None):
+    import zstandard
+    c = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    return (lambda b: c.compress(b)+c.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)),(lambda b=b'': c.compress(b)+c.flush())
+
+_encoders = dict(br=_br_enc, zstd=_zstd_enc, gzip=_gzip_enc)
+_compressible = ('text/', 'application/json', 'application/javascript', 'application/xml', 'image/svg+xml', 'application/manifest+json')
+
+def _can_encode(enc):
+    try: _encoders[enc]()
+    except ImportError: return False
+    return True
+
+# %% ../nbs/api/00_core.ipynb #181264ec
+class CompressMiddleware:
+    "Compress responses of at least `min_size` bytes with the first of `encs` the client accepts, caching the compressed bytes of cacheable ones"
+    def __init__(self, app, min_size=500, encs=('br','zstd','gzip'), levels=None, cache_size=256, cache_max=64*2**10):
+        self.app,self.min_size,self.levels,self.cache_size,self.cache_max = app,min_size,levels or {},cache_size,cache_max
+        self.encs,self.cache = [e for e in encs if _can_encode(e)],OrderedDict()
+
+    def _should(self, status, hdrs):
+        return 200<=status<300 and status not in (204,206) and 'content-encoding' not in hdrs and hdrs.get('content-type', '').startswith(_compressible)
+
+    def _compress(self, enc, body, hdrs):
+        "`body` compressed with `enc`, from the cache if the response is cacheable, i.e. has an `ETag` or public `Cache-Control`"
+        cc = hdrs.get('cache-control', '')
+        if len(body)>self.cache_max or not ('etag' in hdrs or 'public' in cc or 'max-age' in cc) or 'no-store' in cc or 'private' in cc:
+            return _encoders[enc](self.levels.get(enc))[1](body)
+        k = enc,body
+        if (res := self.cache.get(k)) is not None: self.cache.move_to_end(k)
+        else:
+            res = self.cache[k] = _encoders[enc](self.levels.get(enc))[1](body)
+            if len(self.cache) > self.cache_size: self.cache.popitem(last=False)
+        return res
+
+    async def __call__(self, scope, receive, send):
+        if scope['type']!='http': return await self.app(scope, receive, send)
+        accepts = _accept_encs(Headers(scope=scope).get('accept-encoding', ''))
+        if (enc := next((e for e in self.encs if e in accepts), None)) is None: return await self.app(scope, receive, send)
+        start,comp = None,None
+
+        async def send_wrapper(message):
+            nonlocal start,comp
+            if message['type']=='http.response.start':
+                start = message
+                return
+            body,more = message.get('body', b''),message.get('more_body', False)
+            if comp: return await send({**message, 'body': (comp[0] if more else comp[1])(body)})
+            if start is None: return await send(message)
+            msg,start = start,None
+            hdrs = MutableHeaders(scope=msg)
+            if message['type']!='http.response.body' or not self._should(msg['status'], hdrs) or (not more and len(body)<self.min_size):
+                await send(msg)
+                return await send(message)
+            hdrs['content-encoding'] = enc
+            hdrs.add_vary_header('Accept-Encoding')
+            if (etag := hdrs.get('etag')) and not etag.startswith('W/'): hdrs['etag'] = f'W/{etag}'
+            if more:
+                del hdrs['content-length']
+                comp = _encoders[enc](self.levels.get(enc))
+                body = comp[0](body)
+            else:
+                body = self._compress(enc, body, hdrs)
+                hdrs['content-length'] = str(len(body))
+            await send(msg)
+            await send({**message, 'body': body})
+
+        await self.app(scope, receive, send_wrapper)
 
 # %% ../nbs/api/00_core.ipynb #7189daf8
 from functools import wraps
@@ -1114,6 +2058,7 @@ class MiddlewareBase:
 # %% ../nbs/api/00_core.ipynb #83a20f93
 class FtResponse:
     "Wrap an FT response with any Starlette `Response`"
+    resolve_content = True
     def __init__(self, content, status_code:int=200, headers=None, cls=HTMLResponse, media_type:str|None=None, background: BackgroundTask | None = None):
         self.content,self.status_code,self.headers = content,status_code,headers
         self.cls,self.media_type,self.background = cls,media_type,background
@@ -1126,6 +2071,20 @@ class FtResponse:
         headers = {**(self.headers or {}), **httphdrs}
         return self.cls(cts, status_code=self.status_code, headers=headers, media_type=self.media_type, background=tasks)
 
+# %% ../nbs/api/00_core.ipynb #c16e318a
+class StreamingFtResponse(FtResponse):
+    "Like `FtResponse`, but sent in chunks as it renders, starting with a full page's `<head>`; children can be (async) generators"
+    resolve_content = False  # awaitables and (async) generators are consumed as the page streams
+    def __init__(self, content, status_code:int=200, headers=None, media_type:str='text/html', background: BackgroundTask | None = None, chunk_size:int=16384):
+        super().__init__(content, status_code, headers, StreamingResponse, media_type, background)
+        self.chunk_size = chunk_size
+
+    def __response__(self, req):
+        resp,kw = _part_resp(req, self.content)
+        headers = {**(self.headers or {}), **kw['headers']}
+        return self.cls(_xt_stream(req, resp, self.chunk_size), status_code=self.status_code, headers=headers,
+                        media_type=self.media_type, background=kw.get('background') or self.background)
+
 # %% ../nbs/api/00_core.ipynb #9dc1025e
 def unqid(seeded=False):
     "Random unique id, base64-encoded and prefixed with '_' so it's usable as an HTML id"
@@ -1139,15 +2098,159 @@ def _add_ids(s):
     if not getattr(s, 'id', None): s.id = unqid()
     for c in s.children: _add_ids(c)
 
+# %% ../nbs/api/00_core.ipynb #a159e7be
+class LocalBroadcast:
+    "In-process broadcast backend: `publish` calls every `subscribe`d listener with `(topic, text)`"
+    def __init__(self): self.listeners = []
+    def subscribe(self, f): self.listeners.append(f)
+    def unsubscribe(self, f): self.listeners.remove(f)
+    def deliver(self, topic, s):
+        "Call the listeners, returning how many clients they reported sending to"
+        return sum(f(topic, s) or 0 for f in self.listeners)
+    async def start(self): pass
+    async def stop(self): pass
+    async def publish(self, topic, s): return self.deliver(topic, s)
+
+# %% ../nbs/api/00_core.ipynb #d58ea776
+class UnixBroadcast(LocalBroadcast):
+    "Broadcast backend for processes on one machine, each listening on a Unix socket in directory `path`"
+    def __init__(self, path):
+        super().__init__()
+        self.path = Path(path)
+        self.sock,self.server,self.peers,self.clients = self.path/f'{os.getpid()}{unqid()}.sock',None,{},set()
+        self.socks,self.mtime = None,None
+
+    async def start(self):
+        if self.server: return
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.server = await asyncio.start_unix_server(self._serve, self.sock)
+
+    async def stop(self):
+        if self.server: self.server.close()
+        self.server = None
+        self.sock.unlink(missing_ok=True)
+        for f in self.peers.values():
+            if f.done() and not f.exception(): f.result()[1].close()
+        for w in self.clients: w.close()
+        self.peers.clear()
+        await asyncio.sleep(0)  # let connection handlers see their streams close
+
+    async def _serve(self, reader, writer):
+        self.clients.add(writer)
+        try:
+            while True:
+                n = int.from_bytes(await reader.readexactly(4), 'big')
+                msg = _json.loads(await reader.readexactly(n))
+                try: self.deliver(*msg)
+                except Exception as e: warn(f"Broadcast listener failed: {e!r}")
+        except (asyncio.IncompleteReadError, ConnectionError): writer.close()
+        finally: self.clients.discard(writer)
+
+    async def _send(self, p, frame):
+        if (f := self.peers.get(p)) is None or (f.done() and (f.exception() or f.result()[1].is_closing())):
+            f = self.peers[p] = asyncio.ensure_future(asyncio.open_unix_connection(p))
+        try:
+            w = (await f)[1]
+            w.write(frame)
+            await w.drain()
+        except OSError as e:
+            self.peers.pop(p, None)
+            self.socks = None
+            if isinstance(e, (ConnectionRefusedError, FileNotFoundError)): p.unlink(missing_ok=True)  # its process is gone
+
+    def _peer_socks(self):
+        "Other processes' sockets, listed again only when the directory has changed or a send failed"
+        try: mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError: return []
+        if self.socks is None or mtime!=self.mtime:
+            self.socks,self.mtime = [p for p in self.path.glob('*.sock') if p!=self.sock],mtime
+        return self.socks
+
+    async def publish(self, topic, s):
+        res = self.deliver(topic, s)
+        msg = _json.dumps([topic, s])
+        frame = len(msg).to_bytes(4, 'big') + msg
+        await asyncio.gather(*[self._send(p, frame) for p in self._peer_socks()])
+        return res
+
+# %% ../nbs/api/00_core.ipynb #961ecb32
+class _WSConn:
+    "A hub connection: its websocket, topics, and the send queue its writer task drains"
+    def __init__(self, ws, maxsize): self.ws,self.topics,self.queue,self.task = ws,set(),asyncio.Queue(maxsize),None
+
+class WSHub:
+    "Websocket pub/sub: connections subscribe to topics, and each has a bounded send queue and writer task"
+    def __init__(self, maxsize=64, policy='drop_oldest', backend=None):
+        assert policy in ('drop_oldest','drop_new','disconnect'), f"Unknown policy: {policy}"
+        self.maxsize,self.policy,self.conns,self.topics = maxsize,policy,{},{}
+        self.backend,self._started = ifnone(backend, LocalBroadcast()),None
+        self.backend.subscribe(self._deliver)
+
+    def connect(self, ws, *topics):
+        "Add `ws` to the hub, subscribed to `topics`, starting its writer task"
+        if not self._started: self._started = asyncio.ensure_future(self.backend.start())  # start receiving broadcasts
+        if ws not in self.conns:
+            c = self.conns[ws] = _WSConn(ws, self.maxsize)
+            c.task = asyncio.create_task(self._writer(c))
+        self.subscribe(ws, *topics)
+
+    def subscribe(self, ws, *topics):
+        c = self.conns[ws]
+        for t in topics: self.topics.setdefault(t, set()).add(c)
+        c.topics.update(topics)
+
+    def unsubscribe(self, ws, *topics):
+        c = self.conns[ws]
+        for t in topics or tuple(c.topics):
+            if (cs := self.topics.get(t)) is not None:
+                cs.discard(c)
+                if not cs: del self.topics[t]
+            c.topics.discard(t)
+
+    def disconnect(self, ws):
+        "Remove `ws` from the hub and stop its writer task"
+        if (c := self.conns.get(ws)) is None: return
+        self.unsubscribe(ws)
+        del self.conns[ws]
+        if c.task is not asyncio.current_task(): c.task.cancel()
+
+    async def _writer(self, c):
+        try:
+            while True: await c.ws.send_text(await c.queue.get())
+        except asyncio.CancelledError: raise
+        except Exception: self.disconnect(c.ws)  # the client went away
+
+    def _put(self, c, s):
+        try: return c.queue.put_nowait(s)
+        except asyncio.QueueFull: pass
+        if self.policy=='drop_oldest':
+            c.queue.get_nowait()
+            c.queue.put_nowait(s)
+        elif self.policy=='disconnect':
+            self.disconnect(c.ws)
+            asyncio.create_task(c.ws.close(1008))
+
+    def _deliver(self, topic, s):
+        "Queue text `s` for this process's subscribers of `topic` (or all its connections if `None`), returning how many"
+        cs = tuple(self.conns.values() if topic is None else self.topics.get(topic, ()))
+        for c in cs: self._put(c, s)
+        return len(cs)
+
+    async def publish(self, msg, topic=None):
+        "Render `msg` once and broadcast it to subscribers of `topic` (or all connections if `None`), returning how many are local"
+        if not isinstance(msg, str): msg = to_xml(await _resolve(msg), indent=fh_cfg.indent)
+        return await self.backend.publish(topic, msg)
+
 # %% ../nbs/api/00_core.ipynb #1f590f25
 @patch
-def setup_ws(app:FastHTML, f=noop):
-    conns = {}
-    async def on_connect(scope, send): conns[scope.client] = send
-    async def on_disconnect(scope): conns.pop(scope.client)
-    app.ws('/ws', conn=on_connect, disconn=on_disconnect)(f)
-    async def send(s):
-        for o in conns.values(): await o(s)
+def setup_ws(app:FastHTML, f=noop, path='/ws', hub=None):
+    "Add websocket route `path` handled by `f`, with connections in `app.hub`; returns a function sending a message to all of them"
+    app.hub = hub = ifnone(hub, WSHub())
+    app.on_event('shutdown')(hub.backend.stop)
+    async def on_connect(ws): hub.connect(ws)
+    async def on_disconnect(ws): hub.disconnect(ws)
+    app.ws(path, conn=on_connect, disconn=on_disconnect)(f)
+    async def send(s, topic=None): return await hub.publish(s, topic)
     app._send = send
     return send
 
@@ -62,6 +62,7 @@ def fast_app(
         static_path:str=".",  # Where the static file route points to, defaults to root dir
         body_wrap:callable=noop_body, # FT wrapper for body contents
         nb_hdrs:bool=False, # If in notebook include headers inject headers in notebook DOM?
+        compress:bool|dict=False, # Compress responses? Or a dict of `CompressMiddleware` options
         **kwargs):
     "Create a FastHTML or FastHTMLWithLiveReload app."
     from .pico import picolink
@@ -72,7 +73,7 @@ def fast_app(
                   on_startup=on_startup, on_shutdown=on_shutdown, lifespan=lifespan, default_hdrs=default_hdrs, secret_key=secret_key, canonical=canonical,
                   session_cookie=session_cookie, max_age=max_age, sess_path=sess_path, same_site=same_site, sess_https_only=sess_https_only,
                   sess_domain=sess_domain, key_fname=key_fname, exts=exts, surreal=surreal, htmx=htmx, htmx4=htmx4, htmlkw=htmlkw,
-                  reload_attempts=reload_attempts, reload_interval=reload_interval, body_wrap=body_wrap, nb_hdrs=nb_hdrs, **(bodykw or {}))
+                  reload_attempts=reload_attempts, reload_interval=reload_interval, body_wrap=body_wrap, nb_hdrs=nb_hdrs, compress=compress, **(bodykw or {}))
     app.static_route_exts(static_path=static_path)
     if not db_file: return app,app.route
 
@@ -0,0 +1,150 @@
+"""Session middleware: server-side sessions, where the cookie carries only an opaque id and the session itself lives in a store,
+and signed cookie sessions that are only re-signed when they change.
+
+    app = FastHTML(sess_cls=partial(ServerSessionMiddleware, store=SqliteSessionStore('sessions.db')))
+    app = FastHTML(sess_cls=CookieSessionMiddleware)
+
+Handlers see the same `session` dict either way. Store methods may be sync or async; those of stores with `blocking`
+set, such as `SqliteSessionStore`, are run in a worker thread so they don't hold up the event loop."""
+
+import secrets, threading, time
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from itsdangerous import BadSignature
+from pathlib import Path
+from fastcore.utils import maybe_await
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.sessions import SessionMiddleware, Session
+from starlette.requests import HTTPConnection
+from fasthtml.core import _json
+
+__all__ = ["MemorySessionStore", "SqliteSessionStore", "ServerSessionMiddleware", "CookieSessionMiddleware"]
+
+class MemorySessionStore:
+    "In-process LRU store of up to `maxsize` serialised sessions"
+    def __init__(self, maxsize=10_000): self.maxsize,self.sessions,self.lock = maxsize,OrderedDict(),threading.Lock()
+
+    def get(self, sid):
+        with self.lock:
+            if (o := self.sessions.get(sid)) is None: return
+            data,expires = o
+            if expires is not None and expires < time.time():
+                del self.sessions[sid]
+                return
+            self.sessions.move_to_end(sid)
+            return data
+
+    def set(self, sid, data, max_age=None):
+        with self.lock:
+            self.sessions[sid] = data,(time.time()+max_age if max_age else None)
+            self.sessions.move_to_end(sid)
+            if len(self.sessions) > self.maxsize: self.sessions.popitem(last=False)
+
+    def delete(self, sid):
+        with self.lock: self.sessions.pop(sid, None)
+
+class SqliteSessionStore:
+    "Store of serialised sessions in table `tbl` of `db`, a SQLite path or a fastlite `Database`"
+    blocking = True
+    def __init__(self, db='sessions.db', tbl='sessions'):
+        if isinstance(db, (str,Path)):
+            from fastlite import database
+            db = database(db)
+            db.execute('pragma journal_mode=wal')
+            db.execute('pragma synchronous=normal')
+        self.db,self.tbl = db,tbl
+        db.execute(f'create table if not exists {tbl} (id text primary key, data blob, expires real)')
+        self.purge()
+
+    def get(self, sid):
+        for data,expires in self.db.execute(f'select data,expires from {self.tbl} where id=?', [sid]):
+            return data if expires is None or expires >= time.time() else None
+
+    def set(self, sid, data, max_age=None):
+        self.db.execute(f'insert or replace into {self.tbl} (id,data,expires) values (?,?,?)',
+                        [sid, data, time.time()+max_age if max_age else None])
+
+    def delete(self, sid): self.db.execute(f'delete from {self.tbl} where id=?', [sid])
+    def purge(self):
+        "Delete expired sessions"
+        self.db.execute(f'delete from {self.tbl} where expires < ?', [time.time()])
+
+def _changed(sess, payload):
+    "Whether unmodified `sess` differs from the `payload` it was loaded from, which can only happen via a nested list or dict"
+    return any(isinstance(v, (list,dict)) for v in sess.values()) and sess != _json.loads(payload)
+
+async def _store_call(store, nm, *args):
+    "Call `store`'s method `nm`, in a worker thread if the store is `blocking`"
+    f = getattr(store, nm)
+    if getattr(store, 'blocking', False): return await run_in_threadpool(f, *args)
+    return await maybe_await(f(*args))
+
+def _cookie(mw, val, expire=False):
+    "`Set-Cookie` value for session middleware `mw`'s cookie, set to `val` or expired"
+    age = 'expires=Thu, 01 Jan 1970 00:00:00 GMT; ' if expire else f'Max-Age={mw.max_age}; ' if mw.max_age is not None else ''
+    return f'{mw.session_cookie}={val}; path={mw.path}; {age}{mw.security_flags}'
+
+class ServerSessionMiddleware(SessionMiddleware):
+    "Like starlette's `SessionMiddleware`, but keeping sessions in `store`, with just a random session id in the cookie"
+    def __init__(self, app, secret_key='', store=None, **kwargs):
+        super().__init__(app, secret_key, **kwargs)
+        self.store = store if store is not None else MemorySessionStore()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] not in ('http', 'websocket'): return await self.app(scope, receive, send)
+        sid = HTTPConnection(scope).cookies.get(self.session_cookie)
+        data = await _store_call(self.store, 'get', sid) if sid else None
+        if data is None: sid = None
+        scope['session'] = Session(_json.loads(data) if data else {})
+
+        async def send_wrapper(message):
+            nonlocal sid
+            if message['type'] == 'http.response.start':
+                sess,hdrs = scope['session'],MutableHeaders(scope=message)
+                if sess.accessed: hdrs.add_vary_header('Cookie')
+                if sess and (sess.modified or (data and _changed(sess, data))):
+                    sid = sid or secrets.token_urlsafe(32)
+                    await _store_call(self.store, 'set', sid, _json.dumps(sess), self.max_age)
+                    hdrs.append('Set-Cookie', _cookie(self, sid))
+                elif sess.modified and sid:
+                    await _store_call(self.store, 'delete', sid)
+                    hdrs.append('Set-Cookie', _cookie(self, 'null', expire=True))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+class CookieSessionMiddleware(SessionMiddleware):
+    "Like starlette's `SessionMiddleware`, but caching verified cookies, and re-signing only changed sessions or those `refresh` through `max_age`"
+    def __init__(self, app, secret_key, refresh=0.5, cache_size=1024, **kwargs):
+        super().__init__(app, secret_key, **kwargs)
+        self.refresh,self.cache = refresh,MemorySessionStore(cache_size)
+
+    def _load(self, raw):
+        "JSON payload and signing time of cookie `raw`, or `None` if it's invalid or expired"
+        if (o := self.cache.get(raw)) is None:
+            try:
+                payload,ts = self.signer.unsign(raw, max_age=self.max_age, return_timestamp=True)
+                o = b64decode(payload),ts.timestamp()
+                _json.loads(o[0])
+            except (BadSignature, ValueError): return
+            self.cache.set(raw, o, self.max_age)
+        if self.max_age is None or time.time()-o[1] <= self.max_age: return o
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] not in ('http', 'websocket'): return await self.app(scope, receive, send)
+        raw = HTTPConnection(scope).cookies.get(self.session_cookie)
+        payload,ts = (raw and self._load(raw)) or (None,None)
+        scope['session'] = Session(_json.loads(payload) if payload else {})
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                sess,hdrs = scope['session'],MutableHeaders(scope=message)
+                if sess.accessed: hdrs.add_vary_header('Cookie')
+                if sess and (sess.modified or payload is None or _changed(sess, payload) or
+                             (self.max_age and time.time()-ts > self.max_age*self.refresh)):
+                    hdrs.append('Set-Cookie', _cookie(self, self.signer.sign(b64encode(_json.dumps(sess))).decode()))
+                elif not sess and payload is not None and sess.modified: hdrs.append('Set-Cookie', _cookie(self, 'null', expire=True))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -9,7 +9,7 @@ __all__ = ['sid_scr', 'A', 'AX', 'Form', 'Hidden', 'CheckboxX', 'Script', 'Style
            'loose_format', 'ScriptX', 'replace_css_vars', 'StyleX', 'Nbsp', 'Surreal', 'On', 'Prev', 'Now', 'AnyNow',
            'run_js', 'HtmxOn', 'jsd', 'Fragment', 'Titled', 'Socials', 'YouTubeEmbed', 'Favicon', 'clear', 'with_sid',
            'LdJson', 'LdContactPoint', 'LdOrg', 'LdWebsite', 'LdCourseInstance', 'LdCourse', 'robots_txt',
-           'sitemap_url', 'sitemap_xml', 'upload_pb_attrs']
+           'sitemap_url', 'sitemap_xml', 'upload_pb_attrs', 'cached_ft', 'SSEChannel']
 
 # %% ../nbs/api/02_xtend.ipynb #8e2d405b
 from dataclasses import dataclass, asdict
@@ -358,3 +358,108 @@ def upload_pb_attrs(id='uploadprog'):
     js = """{ const p=document.getElementById('%s');
         if(event.detail.total) {p.classList.remove('hidden'); p.value=event.detail.loaded/event.detail.total*100} }""" % id
     return {'hx-on::xhr:progress': js}
+
+# %% ../nbs/api/02_xtend.ipynb #129394f4
+import threading, time, inspect
+from functools import wraps
+from .core import _to_xml
+
+class _NoReq:
+    "Stand-in `req` for `cached_ft` calls without one, which can't resolve route targets"
+    def url_path_for(self, name, **kw):
+        raise ValueError(f"Can't resolve route target {name!r} without a request; pass `req=` to the cached component")
+
+def cached_ft(key=None, ttl:float|None=None, maxsize:int=256):
+    "Decorator caching the HTML rendered by FT component function `f`, keyed by `key(*args, **kwargs)` (default: the args)"
+    def _dec(f):
+        cache,lock = {},threading.Lock()
+        pass_req = 'req' in inspect.signature(f).parameters
+        @wraps(f)
+        def _f(*args, req=None, **kwargs):
+            k = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            k,now = (k, req and req.scope.get('root_path', '')),time.monotonic()
+            try: hash(k)
+            except TypeError: k = None  # e.g. a list arg, with no `key` to map it to something hashable: render uncached
+            with lock:
+                if k is not None and (v := cache.pop(k, None)) and (v[0] is None or v[0]>now):
+                    cache[k] = v
+                    _f.hits += 1
+                    return v[1]
+                _f.misses += 1
+            if pass_req: kwargs['req'] = req
+            elm = f(*args, **kwargs)
+            res = NotStr(_to_xml(req or _NoReq(), elm, fh_cfg.indent))
+            if k is None: return res
+            with lock:
+                cache[k] = (now+ttl if ttl else None),res
+                while len(cache)>maxsize: del cache[next(iter(cache))]
+            return res
+        def invalidate(*args, **kwargs):
+            "Remove the cached HTML for these args, for any root path"
+            k = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            with lock:
+                for o in [o for o in cache if o[0]==k]: del cache[o]
+        def cache_clear():
+            "Remove all cached HTML and reset the counters"
+            with lock: cache.clear()
+            _f.hits = _f.misses = 0
+        _f.hits = _f.misses = 0
+        _f.invalidate,_f.cache_clear = invalidate,cache_clear
+        _f.cache_info = lambda: AttrDict(hits=_f.hits, misses=_f.misses, maxsize=maxsize, currsize=len(cache))
+        return _f
+    return _dec
+
+# %% ../nbs/api/02_xtend.ipynb #d51f08a9
+import asyncio
+from collections import deque
+
+class SSEChannel:
+    "SSE broadcast: `publish` renders an event once, and each client's `stream` gets it from its own bounded queue"
+    def __init__(self, maxsize:int=64, buffer:int=256, heartbeat:float=15, backend=None, topic:str='sse', app=None):
+        self.maxsize,self.heartbeat,self.topic,self.n,self.uid = maxsize,heartbeat,topic,0,unqid()
+        self.subs,self.buf,self._started = set(),deque(maxlen=buffer),None
+        self.backend = ifnone(backend, LocalBroadcast())
+        self.backend.subscribe(self._deliver)
+        if app is not None: app.on_event('shutdown')(self.stop)
+
+    async def start(self):
+        "Start the backend receiving other processes' events, if it hasn't been; `publish` and `stream` call this"
+        if not self._started: self._started = asyncio.ensure_future(self.backend.start())
+        await self._started
+
+    async def stop(self):
+        "Stop the backend; passing `app` calls this when the app shuts down"
+        self._started = None
+        await self.backend.stop()
+
+    async def publish(self, elm, event='message'):
+        "Send `elm` as an `event` to every subscriber, returning how many are in this process"
+        await self.start()
+        self.n += 1
+        return await self.backend.publish(self.topic, f'id: {self.uid}.{self.n}\n' + sse_message(elm, event))
+
+    def _deliver(self, topic, s):
+        if topic!=self.topic: return
+        self.buf.append((s[4:s.index('\n')], s))
+        for q in self.subs:
+            if q.full(): q.get_nowait()  # a slow client loses its oldest event
+            q.put_nowait(s)
+        return len(self.subs)
+
+    async def stream(self, last_id=None):
+        "Async generator of events for one client, starting after event `last_id` if it's still buffered"
+        await self.start()
+        q = asyncio.Queue(self.maxsize)
+        self.subs.add(q)
+        try:
+            ids = [i for i,_ in self.buf]
+            if last_id in ids:
+                for _,s in list(self.buf)[ids.index(last_id)+1:]: yield s
+            while True:
+                try: yield await asyncio.wait_for(q.get(), self.heartbeat)
+                except asyncio.TimeoutError: yield ': ping\n\n'
+        finally: self.subs.discard(q)
+
+    def response(self, req):
+        "An `EventStream` of this channel for `req`, resuming from its `Last-Event-ID` header"
+        return EventStream(self.stream(req.headers.get('last-event-id')))
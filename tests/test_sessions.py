@@ -0,0 +1,91 @@
+from fasthtml.common import *
+import itsdangerous, threading, time
+from base64 import b64encode
+from starlette.testclient import TestClient
+
+def mk_app(store):
+    app = FastHTML(secret_key='soopersecret', sess_cls=partial(ServerSessionMiddleware, store=store))
+    @app.route('/set')
+    def get(session, k:str, v:str): session[k] = v
+    @app.route('/get')
+    def get(session): return dict(session)
+    @app.route('/clear')
+    def get(session): session.clear()
+    return app
+
+def check_store(store):
+    cli = TestClient(mk_app(store))
+    r = cli.get('/set?k=a&v=1')
+    sid = cli.cookies['session_']
+    assert len(sid) < 50 and store.get(sid) is not None
+    r = cli.get('/get')
+    assert r.json() == {'a': '1'}
+    assert 'set-cookie' not in r.headers
+    cli.get('/set?k=b&v=2')
+    assert cli.cookies['session_'] == sid
+    assert cli.get('/get').json() == {'a': '1', 'b': '2'}
+    cli.get('/clear')
+    assert store.get(sid) is None and cli.get('/get').json() == {}
+    cli.cookies.set('session_', 'forged')
+    assert cli.get('/get').json() == {}
+
+def test_memory_store(): check_store(MemorySessionStore())
+
+def test_sqlite_store(tmp_path):
+    check_store(SqliteSessionStore(tmp_path/'sessions.db'))
+
+def test_blocking_store_off_loop():
+    class ThreadStore(MemorySessionStore):
+        blocking,threads = True,set()
+        def get(self, sid):
+            self.threads.add(threading.get_ident())
+            return super().get(sid)
+    async def _loop_thread(): return threading.get_ident()
+    store = ThreadStore()
+    check_store(store)
+    with TestClient(mk_app(store)) as cli:
+        loop_thread = cli.portal.call(_loop_thread)
+        store.threads.clear()
+        cli.get('/set?k=a&v=1')
+        cli.get('/get')
+    assert store.threads and loop_thread not in store.threads
+
+def test_memory_store_lru_and_expiry():
+    store = MemorySessionStore(maxsize=2)
+    for k in 'abc': store.set(k, b'{}')
+    assert store.get('a') is None and store.get('c') == b'{}'
+    store.set('d', b'{}', max_age=-1)
+    assert store.get('d') is None
+
+def test_sqlite_store_expiry(tmp_path):
+    store = SqliteSessionStore(tmp_path/'sessions.db')
+    store.set('a', b'{}', max_age=-1)
+    assert store.get('a') is None
+    store.purge()
+    assert list(store.db.execute('select id from sessions')) == []
+
+def test_cookie_sessions():
+    app = FastHTML(secret_key='soopersecret', sess_cls=CookieSessionMiddleware, max_age=100)
+    @app.route('/add')
+    def get(session, v:str): session.setdefault('l', []).append(v)
+    @app.route('/get')
+    def get(session): return dict(session)
+    cli = app.get_testclient(l=['a'])
+    r = cli.get('/get')
+    assert r.json() == {'l': ['a']} and 'set-cookie' not in r.headers
+    r = cli.get('/add?v=b')
+    assert 'set-cookie' in r.headers and cli.session == {'l': ['a', 'b']}
+    old = itsdangerous.TimestampSigner('soopersecret')
+    old.get_timestamp = lambda: int(time.time())-60
+    cli.cookies.clear()
+    cli.cookies.set('session_', old.sign(b64encode(b'{"l":[]}')).decode())
+    assert 'set-cookie' in cli.get('/get').headers
+    assert 'set-cookie' not in cli.get('/get').headers
+
+def test_cookie_cache():
+    mw = CookieSessionMiddleware(None, 'soopersecret')
+    cookie = mw.signer.sign(b64encode(b'{"a":1}')).decode()
+    assert mw._load(cookie)[0] == b'{"a":1}'
+    assert mw._load(cookie+'x') is None
+    mw.signer = None  # a cache hit doesn't verify the signature again
+    assert mw._load(cookie)[0] == b'{"a":1}'
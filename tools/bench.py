@@ -0,0 +1,473 @@
+#!/usr/bin/env python
+"Micro-benchmarks of FastHTML request hot paths. Usage: `python tools/bench.py [name ...]` (runs all if no names given)"
+import asyncio, sys, time, tracemalloc
+from datetime import date
+from inspect import Parameter
+from fasthtml.common import *
+from fasthtml.core import _send_ws, _WSBatch, _encoders, _scope_host, _params, _find_ps, _ps_plan, _wrap_req, _json_backends, _from_body, _xt_cts, _xt_stream, _resolve, _to_xml, _verbs, _url_for, _page_attrs
+from fasthtml.toaster import toast_after
+from starlette.testclient import TestClient
+
+# µs per call of code paths since removed, timed with this file's `params` and `body_model` setups on the baseline tree:
+# per-request `_find_p` lookup of each param, and per-field `_form_arg` casts of a form into a dataclass
+baselines = dict(params=140.0, body_model=33.5)
+
+benches = {}
+def bench(f):
+    "Register `f` as a benchmark"
+    benches[f.__name__] = f
+    return f
+
+def timed(f, n=10_000):
+    "Mean microseconds per call of `f` over `n` calls"
+    start = time.perf_counter()
+    for _ in range(n): f()
+    return (time.perf_counter()-start)/n*1e6
+
+def atimed(f, n=10_000):
+    "Mean microseconds per call of async `f` over `n` calls"
+    async def _run():
+        start = time.perf_counter()
+        for _ in range(n): await f()
+        return (time.perf_counter()-start)/n*1e6
+    return asyncio.run(_run())
+
+def report(name, **res): print(f'{name:14}', '  '.join(f'{k}: {v:8.2f}µs' for k,v in res.items()))
+
+def mk_req(url='/', headers=None, query_string=b''):
+    "A bare `Request` for benchmarking param lookup"
+    scope = dict(type='http', method='GET', path=url, headers=Headers(headers or {}).raw, query_string=query_string,
+                 scheme='http', client=('127.0.0.1', 8000), server=('127.0.0.1', 8000), path_params={'id':'3'})
+    return Request(scope)
+
+@bench
+def params():
+    "Recorded per-request param dispatch (see `baselines`) vs a precompiled `_ps_plan`"
+    def h(req, sess, htmx, id:int, q:list[str], flag:bool=False, name:str=''): ...
+    plan = _ps_plan(_params(h))
+    req = mk_req(headers={'HX-Request':'1'}, query_string=b'q=a&q=b&flag=1')
+    async def _plan(): return await _find_ps(req, {}, req.headers, plan)
+    report('params', baseline=baselines['params'], plan=atimed(_plan))
+
+@bench
+def hooks():
+    "Per-request hook signatures and skip patterns vs the app's compiled hook pipeline"
+    def auth(req, sess): ...
+    app = FastHTML(secret_key='bench', before=Beforeware(auth, skip=['/login', '/logout', r'/static/.*', r'.*\.css']), after=toast_after)
+    path = '/dashboard'
+    def _dyn():
+        for b in app.before: _params(b.f), any(re.fullmatch(r, path) for r in b.skip)
+        for a in app.after: _params(a)
+    def _comp():
+        bfs,afs = app._hooks()
+        for _,_,bw in bfs: (skip := bw.skip_re) and skip.fullmatch(path)
+    report('hooks', per_request=timed(_dyn), compiled=timed(_comp))
+
+def mk_app(**kw):
+    "A `fast_app` with toasts and a full page and HTMX partial route, plus a `TestClient` for it"
+    app,rt = fast_app(secret_key='bench', **kw)
+    setup_toasts(app)
+    @rt('/')
+    def index(): return Titled('Bench', Ul(*[Li(A(f'Item {i}', href=f'/items/{i}')) for i in range(20)]))
+    @rt('/part')
+    def part(): return Div(P('partial'), id='part')
+    return app,TestClient(app)
+
+@bench
+def page_defaults():
+    "Per-request setup of an HTMX partial: eagerly copying the app's page defaults as `_endp` used to, vs the lazy copies it now makes on first access"
+    app,cli = mk_app()
+    def _eager(req):
+        for o in _page_attrs: getattr(req, o)
+    eapp,ecli = mk_app(before=_eager)
+    hx = {'HX-Request':'1'}
+    def _setup(): _eager(page_req(app))
+    report('page_defaults', eager_setup=timed(_setup), lazy_setup=timed(lambda: page_req(app)),
+           eager_req=timed(lambda: ecli.get('/part', headers=hx), 1000), lazy_req=timed(lambda: cli.get('/part', headers=hx), 1000))
+
+def page_req(app, url='/'):
+    "A `Request` for `app` set up the way `_endp` does, for calling render functions directly"
+    req = mk_req(url)
+    req.scope.update(app=app, root_path='', router=app.router)
+    req._page_defaults = app.hdrs,app.ftrs,app.htmlkw,app.bodykw
+    return req
+
+@bench
+def full_page():
+    "Full-page render via the cached page shell vs building and rendering `respond`'s FT tree"
+    app,_ = mk_app(pico=True, exts=['morph','preload'], ftrs=Footer(P('footer')))
+    cts = Title('Bench'), Main(*[P(f'para {i}') for i in range(20)])
+    def _resp():
+        req = page_req(app)
+        req.hdrs  # a request with its own page defaults is rendered by `respond`
+        return _xt_cts(req, cts)
+    report('full_page', respond=timed(_resp, 2000), shell=timed(lambda: _xt_cts(page_req(app), cts), 2000))
+
+@bench
+def streaming():
+    "Time to first byte of a large table page: rendering all of it with `_xt_cts` vs the first chunk of `_xt_stream`"
+    app,_ = mk_app()
+    cts = Title('Report'), Table(Tbody(*[Tr(Td(i), Td(f'row {i}'), Td(A('edit', href=f'/rows/{i}'))) for i in range(5000)]))
+    async def _first():
+        async for s in _xt_stream(page_req(app), cts): return s
+    report('streaming', full=timed(lambda: _xt_cts(page_req(app), cts), 20), first_chunk=atimed(_first, 20))
+
+@bench
+def resolve():
+    "Six 10ms async widgets awaited one by one in a handler vs resolved concurrently as children, and `_resolve`'s cost on a page with none, deep and at the top level only (as handlers get)"
+    async def widget(i):
+        await asyncio.sleep(0.01)
+        return Div(f'Widget {i}')
+    async def _serial(): return Main(*[await widget(i) for i in range(6)])
+    async def _gathered(): return await _resolve(Main(*[widget(i) for i in range(6)]))
+    page = Title('Bench'), Main(*[P(f'para {i}') for i in range(20)])
+    report('resolve', serial=atimed(_serial, 20), gathered=atimed(_gathered, 20), static_page=atimed(lambda: _resolve(page)),
+           static_top=atimed(lambda: _resolve(page, deep=False)))
+
+@bench
+def fragment_cache():
+    "Building and rendering a product card each time vs a `cached_ft` hit"
+    def card(id): return Div(H3(f'Product {id}'), Img(src=f'/img/{id}.png'), P('A very fine product'), A('View', href=f'/products/{id}'), cls='card')
+    cached = cached_ft()(card)
+    report('fragment_cache', render=timed(lambda: to_xml(card(3))), cached=timed(lambda: cached(3)))
+
+@bench
+def targets():
+    "A 500 row list with a route target per row: a target walk then `to_xml` with uncached `url_path_for`, vs a single memoised pass"
+    app,_ = mk_app()
+    @app.get('/items/{id}', name='item')
+    def item(id:int): ...
+    req = page_req(app, '/items')
+    rows = lambda: Ul(*[Li(f'Item {i}', get=uri('item', id=i%50), hx_target='#detail') for i in range(500)])
+    class _Uncached:
+        url_path_for = lambda _, t, **kw: app.url_path_for(t, **kw)
+    def _two_pass(resp):
+        def _find(o):
+            if isinstance(o, FT):
+                for c in o.children: _find(c)
+                for k,v in _verbs.items():
+                    if t := o.attrs.pop(k, None): o.attrs[v] = _url_for(_Uncached(), t)
+        _find(resp)
+        return to_xml(resp)
+    report('targets', two_pass=timed(lambda: _two_pass(rows()), 200), single_pass=timed(lambda: _to_xml(req, rows(), True), 200))
+
+@bench
+def routing():
+    "Registering 10k routes then matching a path against them: filtering and sorting all routes per add with a linear scan, vs the route index"
+    def _old_add(self, route):
+        route.methods = [m.upper() for m in listify(route.methods)]
+        self.router.routes = [r for r in self.router.routes if not
+                              (r.path==route.path and r.name == route.name and set(r.methods) == set(route.methods))]
+        self.router.routes.append(route)
+        self.router.routes.sort(key=lambda r: not getattr(r, 'host', None))
+    def _startup(add):
+        app,orig = FastHTML(secret_key='bench'),FastHTML.add_route
+        FastHTML.add_route = add
+        def h(id:int): ...
+        try:
+            for i in range(10_000): app.route(f'/t{i%100}/res{i}/{{id}}', name=f'r{i}')(h)
+        finally: FastHTML.add_route = orig
+        return app
+    start = time.perf_counter()
+    _startup(_old_add)
+    old = time.perf_counter()-start
+    start = time.perf_counter()
+    app = _startup(FastHTML.add_route)
+    new = time.perf_counter()-start
+    path = '/t99/res9999/5'
+    scope = mk_req(path).scope
+    def _match(routes):
+        for r in routes:
+            if r.matches(scope)[0]==Match.FULL: return r
+    app.router.candidates(path)  # build the index
+    print(f'{"startup":14} resort: {old*1e3:8.2f}ms  indexed: {new*1e3:8.2f}ms')
+    report('lookup', linear=timed(lambda: _match(app.router.routes), 20), indexed=timed(lambda: _match(app.router.candidates(path)), 2000))
+
+@bench
+def hosts():
+    "Matching a request among 500 tenants' host routes: parsing the host header per route in a linear scan, vs the host index"
+    app = FastHTML(secret_key='bench')
+    def h(id:int=0): ...
+    for i in range(500):
+        for p in ('/', '/about', '/items/{id}'): app.route(p, name=f't{i}{p}', host=f't{i}.example.com')(h)
+    path = '/items/3'
+    def _scope(): return mk_req(path, headers={'host':'t499.example.com:8000'}).scope
+    def _old(scope):
+        for r in app.router.routes:
+            host = Headers(scope=scope).get("host", "").split(":")[0]
+            if r.host_regex.match(host) and Route.matches(r, scope)[0]==Match.FULL: return r
+    def _new(scope):
+        for r in app.router.candidates(path, _scope_host(scope)):
+            if r.matches(scope)[0]==Match.FULL: return r
+    _new(_scope())  # build the index
+    report('hosts', linear=timed(lambda: _old(_scope()), 200), indexed=timed(lambda: _new(_scope()), 2000))
+
+@bench
+def lazy_form():
+    "A handler taking only path and query params, posted a 1000 field form: parsing the body for every request vs only when a param needs it"
+    def h(req, id:int, q:str=''): ...
+    plan,body = _ps_plan(_params(h)),'&'.join(f'f{i}=v{i}' for i in range(1000)).encode()
+    def _req():
+        req = mk_req(headers={'content-type':'application/x-www-form-urlencoded'}, query_string=b'q=x')
+        req.scope['method'] = 'POST'
+        async def _receive(): return dict(type='http.request', body=body, more_body=False)
+        req._receive = _receive
+        return req
+    async def _eager():
+        req = _req()
+        return await _find_ps(req, form2dict(await parse_form(req)), req.headers, plan)
+    report('lazy_form', eager=atimed(_eager, 1000), lazy=atimed(lambda: _wrap_req(_req(), plan), 1000))
+
+@bench
+def upload():
+    "A 20MB file upload: time and peak memory to the first byte of the file with `parse_form`, vs an `UploadStream`"
+    bnd,data = 'benchboundary',b'x'*20_000_000
+    body = (f'--{bnd}\r\nContent-Disposition: form-data; name="f"; filename="a.bin"\r\n\r\n'.encode() + data + f'\r\n--{bnd}--\r\n'.encode())
+    def _req():
+        req = mk_req(headers={'content-type':f'multipart/form-data; boundary={bnd}', 'content-length':str(len(body))})
+        req.scope['method'] = 'POST'
+        chunks = (body[i:i+65536] for i in range(0, len(body), 65536))
+        async def _receive():
+            c = next(chunks, b'')
+            return dict(type='http.request', body=c, more_body=bool(c))
+        req._receive = _receive
+        return req
+    async def _form(): return await (await parse_form(_req()))['f'].read(1)
+    async def _stream():
+        async for p in UploadStream(_req()):
+            async for c in p: return c[:1]
+    def _peak(f):
+        tracemalloc.start()
+        asyncio.run(f())
+        res = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return res/1e6
+    report('upload', parse_form=atimed(_form, 5), stream=atimed(_stream, 5))
+    print(f'{"upload_peak":14} parse_form: {_peak(_form):8.2f}MB  stream: {_peak(_stream):8.2f}MB')
+
+@bench
+def json_backends():
+    "Encoding and decoding a 1000 row API response with each installed JSON backend"
+    rows = [dict(id=i, title=f'Todo {i}', done=i%2==0, tags=['a','b'], score=i/7, due=f"2024-01-{1+i%28:02}") for i in range(1000)]
+    s = _json_backends['json']()[0](rows)
+    for nm,f in _json_backends.items():
+        try: dumps,loads = f()
+        except ImportError: continue
+        report(nm, dumps=timed(lambda: dumps(rows), 200), loads=timed(lambda: loads(s), 200))
+
+@bench
+def body_model():
+    "Decoding a todo form into a dataclass: recorded per-request annotation lookup and casts (see `baselines`), vs the cached `_body_decoder`"
+    @dataclass
+    class Todo: title:str; id:int=0; done:bool=False; priority:int=0; tags:list[str]=None; due:date=None; notes:str=''; owner:str=''
+    data = dict(title='Buy milk', id='3', done='on', priority='2', tags=['a','b'], due='2024-05-01', notes='', owner='jh')
+    p,req = Parameter('todo', Parameter.POSITIONAL_OR_KEYWORD, annotation=Todo),mk_req()
+    report('body_model', baseline=baselines['body_model'], compiled=atimed(lambda: _from_body(req, p, data)))
+
+async def run_asgi(app, scope):
+    "Run ASGI `app` on `scope`, returning the response start message"
+    msgs = []
+    async def _receive(): return dict(type='http.request', body=b'', more_body=False)
+    async def _send(m): msgs.append(m)
+    await app(dict(scope), _receive, _send)
+    return msgs[0]
+
+@bench
+def sessions():
+    "A request updating a 2KB session: re-signing it into the cookie with `SessionMiddleware`, vs storing it with `ServerSessionMiddleware`"
+    cart = [dict(id=i, name=f'Product {i}', qty=1) for i in range(40)]
+    async def inner(scope, receive, send):
+        sess = scope['session']
+        sess.setdefault('cart', cart)
+        sess['n'] = sess.get('n', 0)+1
+        await Response('ok')(scope, receive, send)
+    for nm,mw in (('cookie', SessionMiddleware(inner, 'bench', 'session_')), ('server', ServerSessionMiddleware(inner, 'bench', session_cookie='session_'))):
+        start = asyncio.run(run_asgi(mw, mk_req().scope))
+        cookie = dict(start['headers'])[b'set-cookie'].split(b';')[0]
+        scope = mk_req(headers={'cookie': cookie.decode()}).scope
+        us = atimed(lambda: run_asgi(mw, scope), 2000)
+        hdr = len(dict(asyncio.run(run_asgi(mw, scope))['headers'])[b'set-cookie'])
+        print(f'{nm:14} {us:8.2f}µs  set-cookie: {hdr} bytes')
+
+@bench
+def session_reads():
+    "A request reading a 2KB cookie session: verifying and re-signing it with `SessionMiddleware`, vs `CookieSessionMiddleware`"
+    cart = [dict(id=i, name=f'Product {i}', qty=1) for i in range(40)]
+    async def inner(scope, receive, send):
+        scope['session'].setdefault('cart', cart)
+        await Response('ok')(scope, receive, send)
+    res = {}
+    for nm,cls in (('starlette', SessionMiddleware), ('cached', CookieSessionMiddleware)):
+        mw = cls(inner, 'bench', session_cookie='session_')
+        cookie = dict(asyncio.run(run_asgi(mw, mk_req().scope))['headers'])[b'set-cookie'].split(b';')[0]
+        res[nm] = atimed(lambda: run_asgi(mw, mk_req(headers={'cookie': cookie.decode()}).scope), 2000)
+    report('session_reads', **res)
+
+@bench
+def ws_fanout():
+    "Broadcasting a message list to 500 websockets, one of them slow: the old serial `setup_ws` send, vs `WSHub.publish`"
+    class _WS:
+        def __init__(self, delay=0): self.delay = delay
+        async def send_text(self, s): await asyncio.sleep(self.delay)
+    msg = Ul(*[Li(f'message {i}') for i in range(20)], id='msg-list')
+    async def _run():
+        wss = [_WS(0.05 if i==0 else 0) for i in range(500)]
+        hub = WSHub()
+        for o in wss: hub.connect(o)
+        start = time.perf_counter()
+        for o in wss: await _send_ws(o, msg)
+        serial = time.perf_counter()-start
+        start = time.perf_counter()
+        await hub.publish(msg)
+        hubbed = time.perf_counter()-start
+        for o in wss: hub.disconnect(o)
+        return serial*1e6,hubbed*1e6
+    serial,hubbed = asyncio.run(_run())
+    report('ws_fanout', serial=serial, hub=hubbed)
+
+@bench
+def broadcast():
+    "Delivery latency of a 2KB message to a listener in the same process with `LocalBroadcast`, vs through a peer's socket with `UnixBroadcast`"
+    import tempfile
+    msg = 'x'*2000
+    async def _run():
+        got = asyncio.Event()
+        local = LocalBroadcast()
+        local.subscribe(lambda t,s: got.set())
+        d = tempfile.mkdtemp()
+        pub,sub = UnixBroadcast(d),UnixBroadcast(d)
+        sub.subscribe(lambda t,s: got.set())
+        await sub.start()
+        res = {}
+        for nm,b in (('local', local), ('unix', pub)):
+            start = time.perf_counter()
+            for _ in range(1000):
+                got.clear()
+                await b.publish('t', msg)
+                await got.wait()
+            res[nm] = (time.perf_counter()-start)/1000*1e6
+        await pub.stop(); await sub.stop()
+        return res
+    report('broadcast', **asyncio.run(_run()))
+
+@bench
+def sse():
+    "Mean time from an update to 200 SSE clients having it: per-client 100ms polling loops, vs `SSEChannel` push"
+    async def _run():
+        state = dict(ver=0)
+        async def _poll():
+            ver = state['ver']
+            while True:
+                await asyncio.sleep(0.1)
+                if ver != state['ver']: return sse_message(P('update'))
+        tasks = [asyncio.create_task(_poll()) for _ in range(200)]
+        await asyncio.sleep(0.03)
+        start = time.perf_counter()
+        state['ver'] += 1
+        await asyncio.gather(*tasks)
+        polled = time.perf_counter()-start
+        chan = SSEChannel()
+        gens = [chan.stream() for _ in range(200)]
+        tasks = [asyncio.create_task(anext(g)) for g in gens]
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        await chan.publish(P('update'))
+        await asyncio.gather(*tasks)
+        pushed = time.perf_counter()-start
+        for g in gens: await g.aclose()
+        return polled*1e6,pushed*1e6
+    polled,pushed = asyncio.run(_run())
+    report('sse', polling=polled, channel=pushed)
+
+@bench
+def ws_coalesce():
+    "Sending 200 counter updates and a status line to a websocket, per-send frames vs coalesced into one frame per tick"
+    class _WS:
+        def __init__(self): self.frames = 0
+        async def send_text(self, s): self.frames += 1
+    async def _run(ws):
+        for i in range(200): await _send_ws(ws, Div(i, id='count'))
+        await _send_ws(ws, P('status'))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+    def _direct(): asyncio.run(_run(_WS()))
+    def _coalesced():
+        ws = _WS()
+        ws._fh_batch = _WSBatch(ws, 0)
+        asyncio.run(_run(ws))
+    report('ws_coalesce', direct=timed(_direct, 100), coalesced=timed(_coalesced, 100))
+
+@bench
+def static():
+    "Requests for a 4KB CSS file: `FileResponse` per request, vs a `StaticCache` hit, vs a `StaticCache` revalidation answered with 304"
+    import tempfile
+    d = Path(tempfile.mkdtemp())
+    (d/'app.css').write_text('body{margin:0}'*300)
+    app = FastHTML()
+    @app.get('/old/{fname:path}.{ext:static}')
+    async def get(fname:str, ext:str): return FileResponse(f'{d}/{fname}.{ext}')
+    app.static_route_exts(prefix='/new/', static_path=d)
+    cli = TestClient(app)
+    etag = cli.get('/new/app.css').headers['etag']
+    report('static', file_response=timed(lambda: cli.get('/old/app.css'), 1000), cached=timed(lambda: cli.get('/new/app.css'), 1000),
+           not_modified=timed(lambda: cli.get('/new/app.css', headers={'if-none-match': etag}), 1000))
+
+@bench
+def vurl_manifest():
+    "`vurl` for an unchanged file: hashing with an mtime check, vs resolving from a manifest loaded with `set_vurl_manifest`"
+    import tempfile
+    d = Path(tempfile.mkdtemp())
+    (d/'app.css').write_text('body{margin:0}'*300)
+    stat = timed(lambda: vurl('/app.css', d))
+    set_vurl_manifest(asset_manifest(d))
+    mf = timed(lambda: vurl('/app.css', d))
+    set_vurl_manifest()
+    report('vurl_manifest', stat=stat, manifest=mf)
+
+@bench
+def compress():
+    "Compressing a full page with an inlined script: starlette's `GZipMiddleware`, vs `CompressMiddleware`, whose cache serves repeats"
+    from starlette.middleware.gzip import GZipMiddleware
+    req = page_req(FastHTML())
+    body = _xt_cts(req, (Title('Bench'), MarkdownJS(), Main(Ul(*[Li(f'Item {i}') for i in range(200)])))).encode()
+    async def inner(scope, receive, send): await Response(body, media_type='text/html', headers={'cache-control': 'public, max-age=60'})(scope, receive, send)
+    scope = mk_req(headers={'accept-encoding': 'gzip'}).scope
+    gz,comp = GZipMiddleware(inner),CompressMiddleware(inner, encs=['gzip'])
+    print(f"{'':14} {len(body)} bytes, {len(_encoders['gzip']()[1](body))} gzipped")
+    report('compress', plain=atimed(lambda: run_asgi(inner, scope), 2000), gzip_mw=atimed(lambda: run_asgi(gz, scope), 2000),
+           compress=atimed(lambda: run_asgi(comp, scope), 2000))
+
+@bench
+def http_cache():
+    "Revalidating a 200-item page: rendering it in full, vs a body `ETag` 304, vs a `key` `ETag` 304 that skips the handler"
+    app = FastHTML()
+    def page(): return Titled('Bench', Ul(*[Li(A(f'Item {i}', href=f'/items/{i}')) for i in range(200)]))
+    app.get('/plain')(page)
+    app.get('/body', cache=HttpCache())(page)
+    app.get('/key', cache=HttpCache(key=lambda: 1))(page)
+    cli = TestClient(app)
+    ebody,ekey = cli.get('/body').headers['etag'],cli.get('/key').headers['etag']
+    report('http_cache', full=timed(lambda: cli.get('/plain'), 500), body_etag=timed(lambda: cli.get('/body', headers={'if-none-match': ebody}), 500),
+           key_etag=timed(lambda: cli.get('/key', headers={'if-none-match': ekey}), 500))
+
+@bench
+def response_cache():
+    "A page with 20ms of data loading and a 200-item render: uncached, vs served by `ResponseCache`, vs 20 concurrent misses coalesced into one render"
+    async def page():
+        await asyncio.sleep(0.02)
+        return Titled('Bench', Ul(*[Li(A(f'Item {i}', href=f'/items/{i}')) for i in range(200)]))
+    rc = ResponseCache(ttl=3600)
+    app = FastHTML()
+    app.get('/plain')(page)
+    app.get('/cached', cache=rc)(page)
+    cli = TestClient(app)
+    cli.get('/cached')
+    scope = mk_req('/cached').scope
+    async def _misses():
+        rc.invalidate()
+        await asyncio.gather(*[run_asgi(app, scope) for _ in range(20)])
+    report('response_cache', uncached=timed(lambda: cli.get('/plain'), 50), cached=timed(lambda: cli.get('/cached'), 500),
+           misses_20=atimed(_misses, 20))
+
+if __name__=='__main__':
+    for k in sys.argv[1:] or benches: benches[k]()